@@ -57,6 +57,10 @@ if TYPE_CHECKING:
     from .artifact import ArtifactOperations
     from .conversation import ConversationOperations
 
+# Per-connection prepared-statement cache (sqlite3 default is 128); one
+# Core connection serves every operations class, so hot SQL stays prepared
+_STATEMENT_CACHE_SIZE = 256
+
 
 class Core:
     """
@@ -264,9 +268,26 @@ class Core:
                 pass
 
 
-def _create_connection() -> sqlite3.Connection:
+def _resolve_db_path(db_path: str | Path | None) -> Path:
+    """Resolve the Core database path (RFC-004).
+
+    Order: explicit db_path, then settings.database_path, then
+    get_db_path('core') using environment variables.
+    """
+    if db_path is not None:
+        return Path(db_path)
+    if settings.database_path is not None:
+        return Path(settings.database_path)
+    from system.host.environment import get_db_path
+    return get_db_path('core')
+
+
+def _create_connection(db_path: str | Path | None = None) -> sqlite3.Connection:
     """Create a fresh database connection.
 
+    Args:
+        db_path: Core database file. If None, resolved via _resolve_db_path.
+
     Returns:
         SQLite connection with row_factory set to sqlite3.Row,
         foreign keys enabled, and WAL mode for concurrent access.
@@ -276,19 +297,14 @@ def _create_connection() -> sqlite3.Connection:
         by enabling readers to proceed without blocking writers.
 
         Database path is resolved via RFC-004:
+        - db_path if provided (explicit path)
         - settings.database_path if provided (explicit path, backward compatible)
         - Otherwise get_db_path('core') using environment variables
     """
-    # Resolve database path (RFC-004)
-    if settings.database_path is None:
-        from system.host.environment import get_db_path
-        db_path = get_db_path('core')
-    else:
-        db_path = Path(settings.database_path)
-
+    db_path = _resolve_db_path(db_path)
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    conn = sqlite3.connect(str(db_path))
+    conn = sqlite3.connect(str(db_path), cached_statements=_STATEMENT_CACHE_SIZE)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
     # Enable WAL mode for better concurrent access
@@ -296,10 +312,14 @@ def _create_connection() -> sqlite3.Connection:
     return conn
 
 
-def get_core() -> Core:
+def get_core(db_path: str | Path | None = None) -> Core:
     """
     Get a database Core instance.
 
+    Args:
+        db_path: Path to the Core database file. If None, resolved via
+            settings.database_path or get_db_path('core') (RFC-004).
+
     Returns:
         Core instance with entity/transaction operations
 
@@ -315,7 +335,7 @@ def get_core() -> Core:
         Core MUST be used as context manager. Operations will raise
         RuntimeError if called outside of 'with' statement.
     """
-    conn = _create_connection()
+    conn = _create_connection(db_path)
     return Core(conn)
 
 
@@ -414,23 +434,18 @@ def _run_migrations(db: sqlite3.Connection) -> None:
         pass
 
 
-def init_db():
+def init_db(db_path: str | Path | None = None):
     """Initialize database by running schema.sql if not already initialized.
 
     Also checks schema version and applies migrations if the database exists
     but is at an older schema version.
 
     Database path is resolved via RFC-004:
+    - db_path if provided (explicit path)
     - settings.database_path if provided (explicit path, backward compatible)
     - Otherwise get_db_path('core') using environment variables
     """
-    # Resolve database path (RFC-004)
-    if settings.database_path is None:
-        from system.host.environment import get_db_path
-        db_path = get_db_path('core')
-    else:
-        db_path = Path(settings.database_path)
-
+    db_path = _resolve_db_path(db_path)
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     with sqlite3.connect(str(db_path)) as db:
@@ -463,7 +478,7 @@ def init_db():
 # SYSTEM INITIALIZATION (Phase 7: Move DB initialization from API to System)
 # ============================================================================
 
-def init_system() -> dict:
+def init_system(deep_check: bool = True) -> dict:
     """Initialize both Core and Soil databases and run consistency checks.
 
     This function performs greenfield database initialization for the entire
@@ -478,6 +493,12 @@ def init_system() -> dict:
     The system is always-available - startup succeeds even if databases
     are missing (they will be created automatically).
 
+    Args:
+        deep_check: If True (default), scan for orphaned EntityDeltas and
+            broken hash chains; if False, only run the constant-time
+            TransactionCoordinator.quick_check() and leave deep_check() to
+            a maintenance task
+
     Returns:
         Dict with keys:
         - 'status': SystemStatus enum value ('normal', 'inconsistent', 'read_only', 'safe_mode')
@@ -524,7 +545,8 @@ def init_system() -> dict:
         soil_db_path=soil_db_path,
         core_db_path=core_db_path
     )
-    system_status = coordinator.check_consistency()
+    system_status = coordinator.check_consistency(deep=deep_check)
+    coordinator.close()
 
     # Check if admin user exists
     has_admin = False
@@ -33,6 +33,16 @@ if TYPE_CHECKING:
     from . import Core
 
 
+# Delta operation patterns, keyed by leading symbol
+# Per spec: fragment IDs are ^ followed by exactly 3 lowercase alphanumeric chars
+_OP_PATTERNS = {
+    '+': re.compile(r'^\+(\d+):(\^[a-z0-9]{3})$'),
+    '-': re.compile(r'^-(\d+)$'),
+    '~': re.compile(r'^~(\d+):(\^[a-z0-9]{3})→(\^[a-z0-9]{3})$'),
+    '>': re.compile(r'^>(\d+)@(\d+)$'),
+}
+
+
 @dataclass
 class DeltaOp:
     """Single delta operation for artifact modification.
@@ -46,9 +56,13 @@ class DeltaOp:
     target_line: int | None = None  # Target position (for move)
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffResult:
-    """Result of diffing two artifact commits."""
+    """Result of diffing two artifact commits.
+
+    Slotted: diff_commits builds one per line, so dropping the per-instance
+    __dict__ keeps large diffs compact.
+    """
 
     line_number: int
     old_content: str | None
@@ -82,56 +96,43 @@ def parse_delta_ops(ops_string: str) -> list[DeltaOp]:
     ops = []
     lines = ops_string.strip().split('\n')
 
-    # Patterns for each operation type
-    # Per spec: fragment IDs are ^ followed by exactly 3 lowercase alphanumeric chars
-    add_pattern = re.compile(r'^\+(\d+):(\^[a-z0-9]{3})$')
-    remove_pattern = re.compile(r'^-(\d+)$')
-    replace_pattern = re.compile(r'^~(\d+):(\^[a-z0-9]{3})→(\^[a-z0-9]{3})$')
-    move_pattern = re.compile(r'^>(\d+)@(\d+)$')
-
     for line_num, line_str in enumerate(lines, 1):
         line_str = line_str.strip()
         if not line_str:
             continue  # Skip empty lines
 
-        match = add_pattern.match(line_str)
-        if match:
+        # The leading symbol selects the one pattern worth trying
+        pattern = _OP_PATTERNS.get(line_str[0])
+        match = pattern.match(line_str) if pattern else None
+
+        if match is None:
+            raise ValueError(f"Invalid delta operation at line {line_num}: {line_str}")
+
+        op = line_str[0]
+        if op == '+':
             ops.append(DeltaOp(
                 op_type='add',
                 line=int(match.group(1)),
                 fragment=match.group(2)
             ))
-            continue
-
-        match = remove_pattern.match(line_str)
-        if match:
+        elif op == '-':
             ops.append(DeltaOp(
                 op_type='remove',
                 line=int(match.group(1))
             ))
-            continue
-
-        match = replace_pattern.match(line_str)
-        if match:
+        elif op == '~':
             ops.append(DeltaOp(
                 op_type='replace',
                 line=int(match.group(1)),
                 fragment=match.group(2),
                 replacement=match.group(3)
             ))
-            continue
-
-        match = move_pattern.match(line_str)
-        if match:
+        else:
             ops.append(DeltaOp(
                 op_type='move',
                 line=int(match.group(1)),
                 target_line=int(match.group(2))
             ))
-            continue
-
-        # If we get here, line didn't match any pattern
-        raise ValueError(f"Invalid delta operation at line {line_num}: {line_str}")
 
     return ops
 
@@ -199,7 +200,9 @@ def compute_content_hash(content: str) -> str:
     Returns:
         Hex-encoded SHA-256 hash (first 8 characters for commit ID)
     """
-    return hashlib.sha256(content.encode()).hexdigest()[:8]
+    # Hex only the 4 digest bytes kept (same value as hexdigest()[:8]).
+    # Stays SHA-256: commit IDs are persisted, so the algorithm is fixed
+    return hashlib.sha256(content.encode()).digest()[:4].hex()
 
 
 def diff_commits(old_content: str, new_content: str) -> list[DiffResult]:
@@ -213,30 +216,38 @@ def diff_commits(old_content: str, new_content: str) -> list[DiffResult]:
         List of DiffResult objects showing changes
     """
     old_lines = old_content.split('\n')
-    new_lines = new_content.split('\n')
-
-    results = []
-    max_lines = max(len(old_lines), len(new_lines))
 
-    for i in range(max_lines):
-        old_line = old_lines[i] if i < len(old_lines) else None
-        new_line = new_lines[i] if i < len(new_lines) else None
+    # Identical versions (e.g. diffing a commit against itself): one string
+    # compare in C instead of one per line
+    if old_content == new_content:
+        return [
+            DiffResult(line_number=i, old_content=line, new_content=line, change_type="unchanged")
+            for i, line in enumerate(old_lines, 1)
+        ]
 
-        if old_line == new_line:
-            change_type = "unchanged"
-        elif old_line is None:
-            change_type = "added"
-        elif new_line is None:
-            change_type = "removed"
-        else:
-            change_type = "modified"
+    new_lines = new_content.split('\n')
 
-        results.append(DiffResult(
-            line_number=i + 1,  # 1-based
+    # Lines are compared by position: walk the overlapping range pairwise,
+    # then the longer side's tail is all added or all removed
+    results = [
+        DiffResult(
+            line_number=i,  # 1-based
             old_content=old_line,
             new_content=new_line,
-            change_type=change_type
-        ))
+            change_type="unchanged" if old_line == new_line else "modified",
+        )
+        for i, (old_line, new_line) in enumerate(zip(old_lines, new_lines), 1)
+    ]
+
+    common = len(results)
+    results.extend(
+        DiffResult(line_number=i, old_content=None, new_content=line, change_type="added")
+        for i, line in enumerate(new_lines[common:], common + 1)
+    )
+    results.extend(
+        DiffResult(line_number=i, old_content=line, new_content=None, change_type="removed")
+        for i, line in enumerate(old_lines[common:], common + 1)
+    )
 
     return results
 
@@ -300,10 +311,44 @@ class ArtifactOperations:
             5. Update Artifact entity (content, hash, append delta to list)
             6. Create triggers relation from source Message -> delta
         """
-        from ..soil import Soil
+        return self.commit_deltas(artifact_uuid, [{
+            "ops_string": ops_string,
+            "references": references,
+            "based_on_hash": based_on_hash,
+            "source_message_uuid": source_message_uuid,
+        }])[0]
+
+    def commit_deltas(
+        self,
+        artifact_uuid: str,
+        deltas: list[dict],
+    ) -> list[dict]:
+        """Commit a sequence of artifact deltas in one batch.
+
+        Each delta is a dict with the commit_delta arguments (ops_string,
+        references, based_on_hash, optional source_message_uuid) and must be
+        based on the hash the previous one produces, the first on the
+        artifact's current hash. The whole chain is validated and applied in
+        memory before anything is written, so a conflict or invalid delta
+        leaves the artifact untouched.
+
+        Args:
+            artifact_uuid: UUID of artifact to modify
+            deltas: Delta specs, in commit order
+
+        Returns:
+            One commit_delta result dict per delta, in order
+
+        Raises:
+            ConflictError: If a based_on_hash breaks the chain
+            ResourceNotFound: If artifact doesn't exist
+            ValueError: If delta operations are invalid
+        """
+        from ..soil import Fact, generate_soil_uuid
 
         # Strip prefix from artifact UUID
         artifact_uuid = uid.strip_prefix(artifact_uuid)
+        prefixed_uuid = uid.add_core_prefix(artifact_uuid)
 
         # Get current artifact state
         row = self._conn.execute(
@@ -317,92 +362,94 @@ class ArtifactOperations:
         if row["type"] != "Artifact":
             raise ValueError(f"Entity {artifact_uuid} is not an Artifact")
 
-        # Check optimistic lock
-        current_hash = row["hash"]
-        if current_hash != based_on_hash:
-            raise ConflictError(
-                f"Artifact modified since last read. "
-                f"Expected hash {based_on_hash}, current hash {current_hash}",
-                artifact_uuid=artifact_uuid,
-                expected_hash=based_on_hash,
-                actual_hash=current_hash,
-            )
-
         # Parse artifact data
         data = json.loads(row["data"])
-        current_content = data.get("content", "")
-
-        # Parse and apply delta operations
-        try:
-            ops = parse_delta_ops(ops_string)
-        except ValueError as e:
-            raise ValueError(f"Invalid delta operations: {e}") from e
-
-        new_content = apply_delta_ops(current_content, ops)
-        new_hash = compute_content_hash(new_content)
-
-        # Update artifact data
-        data["content"] = new_content
-
-        # Get current deltas list (ensure it exists in data)
-        if "deltas" not in data:
-            data["deltas"] = []
-        current_deltas = data["deltas"]
-
-        # Create ArtifactDelta Fact in Soil
-        from ..soil import Fact, generate_soil_uuid
+        content = data.get("content", "")
+        current_hash = row["hash"]
 
-        delta_fact = Fact(
-            uuid=generate_soil_uuid(),
-            _type="ArtifactDelta",
-            realized_at=isodatetime.now(),
-            canonical_at=isodatetime.now(),
-            fidelity="full",
-            data={
-                "artifact_uuid": uid.add_core_prefix(artifact_uuid),
-                "ops": ops_string,
-                "based_on_hash": based_on_hash,
-                "result_hash": new_hash,
-            },
-        )
+        # Validate the hash chain and apply every delta in memory
+        results = []
+        delta_facts = []
+        for delta in deltas:
+            based_on_hash = delta["based_on_hash"]
+
+            # Check optimistic lock
+            if current_hash != based_on_hash:
+                raise ConflictError(
+                    f"Artifact modified since last read. "
+                    f"Expected hash {based_on_hash}, current hash {current_hash}",
+                    artifact_uuid=artifact_uuid,
+                    expected_hash=based_on_hash,
+                    actual_hash=current_hash,
+                )
+
+            # Parse and apply delta operations
+            try:
+                ops = parse_delta_ops(delta["ops_string"])
+            except ValueError as e:
+                raise ValueError(f"Invalid delta operations: {e}") from e
+
+            content = apply_delta_ops(content, ops)
+            new_hash = compute_content_hash(content)
+
+            now = isodatetime.now()
+            delta_facts.append(Fact(
+                uuid=generate_soil_uuid(),
+                _type="ArtifactDelta",
+                realized_at=now,
+                canonical_at=now,
+                fidelity="full",
+                data={
+                    "artifact_uuid": prefixed_uuid,
+                    "ops": delta["ops_string"],
+                    "based_on_hash": based_on_hash,
+                    "result_hash": new_hash,
+                },
+            ))
+            results.append({
+                "artifact_uuid": prefixed_uuid,
+                "previous_hash": current_hash,
+                "new_hash": new_hash,
+                "new_content": content,
+                "line_count": content.count('\n') + 1,
+            })
+            current_hash = new_hash
+
+        if not results:
+            return []
 
+        # Create all ArtifactDelta Facts in Soil with one batched INSERT
         with get_soil() as soil:
-            delta_uuid = soil.create_fact(delta_fact)
-
-        # Add delta to artifact's delta list
-        # delta_uuid already has soil_ prefix from Fact creation
-        current_deltas.append(delta_uuid)
+            delta_uuids = soil.create_facts(delta_facts)
 
-        # Update artifact entity
-        data_json = json.dumps(data)
+        # Update artifact entity once with the final state
+        # delta_uuids already have soil_ prefix from Fact creation
+        data["content"] = content
+        data.setdefault("deltas", []).extend(delta_uuids)
         self._conn.execute(
             """UPDATE entity
                SET data = ?, hash = ?, updated_at = ?
                WHERE uuid = ?""",
-            (data_json, new_hash, isodatetime.now(), artifact_uuid)
+            (json.dumps(data), current_hash, isodatetime.now(), artifact_uuid)
         )
         self._conn.commit()
 
-        # Create triggers relation if source message provided
-        if source_message_uuid:
-            source_message_uuid = uid.strip_prefix(source_message_uuid)
-            self._core.relation.create(
-                kind="triggers",
-                source=source_message_uuid,
-                source_type="item",
-                target=uid.strip_prefix(delta_uuid),
-                target_type="item",
-                initial_horizon_days=7,
-            )
+        for delta, result, delta_uuid in zip(deltas, results, delta_uuids):
+            result["delta_uuid"] = delta_uuid  # Already has soil_ prefix
 
-        return {
-            "artifact_uuid": uid.add_core_prefix(artifact_uuid),
-            "previous_hash": current_hash,
-            "new_hash": new_hash,
-            "new_content": new_content,
-            "delta_uuid": delta_uuid,  # Already has soil_ prefix
-            "line_count": len(new_content.split('\n')),
-        }
+            # Create triggers relation if source message provided
+            source_message_uuid = delta.get("source_message_uuid")
+            if source_message_uuid:
+                self._core.relation.create(
+                    kind="triggers",
+                    source=uid.strip_prefix(source_message_uuid),
+                    source_type="item",
+                    target=uid.strip_prefix(delta_uuid),
+                    target_type="item",
+                    initial_horizon_days=7,
+                )
+
+        return results
 
     def get_at_commit(
         self,
@@ -430,9 +477,12 @@ class ArtifactOperations:
         # Strip prefix from artifact UUID
         artifact_uuid = uid.strip_prefix(artifact_uuid)
 
-        # Get current artifact state
+        # Get current artifact state (only content is needed from data, so
+        # it is extracted in SQL rather than parsing the whole document)
         row = self._conn.execute(
-            "SELECT uuid, type, data FROM entity WHERE uuid = ?",
+            """SELECT uuid, type,
+                      COALESCE(json_extract(data, '$.content'), '') AS content
+               FROM entity WHERE uuid = ?""",
             (artifact_uuid,)
         ).fetchone()
 
@@ -442,17 +492,19 @@ class ArtifactOperations:
         if row["type"] != "Artifact":
             raise ValueError(f"Entity {artifact_uuid} is not an Artifact")
 
-        data = json.loads(row["data"])
+        content = row["content"]
+        line_count = content.count('\n') + 1
 
-        # Special case: if commit_hash matches current, return current content
-        # This handles the case of no deltas applied yet
-        current_hash = compute_content_hash(data.get("content", ""))
+        # Special case: if commit_hash matches current, return current content.
+        # entity.hash is the hash-chain value and only equals the content hash
+        # after commit_delta, so always hash the content itself.
+        current_hash = compute_content_hash(content)
         if current_hash == commit_hash:
             return {
                 "artifact_uuid": uid.add_core_prefix(artifact_uuid),
                 "hash": current_hash,
-                "content": data.get("content", ""),
-                "line_count": len(data.get("content", "").split('\n')),
+                "content": content,
+                "line_count": line_count,
                 "at_commit": commit_hash,
             }
 
@@ -470,8 +522,8 @@ class ArtifactOperations:
         return {
             "artifact_uuid": uid.add_core_prefix(artifact_uuid),
             "hash": current_hash,
-            "content": data.get("content", ""),
-            "line_count": len(data.get("content", "").split('\n')),
+            "content": content,
+            "line_count": line_count,
             "at_commit": commit_hash,
             "note": "Historical commit reconstruction deferred - returning current state",
         }
@@ -566,23 +618,25 @@ class ArtifactOperations:
 
         # For MVP: Return deltas stored in artifact.data
         # Future: Query Soil directly for ArtifactDelta items
+        # Only the deltas list is extracted; the artifact content is never
+        # handed to Python or parsed
         row = self._conn.execute(
-            "SELECT data FROM entity WHERE uuid = ?",
+            "SELECT json_extract(data, '$.deltas') AS deltas FROM entity WHERE uuid = ?",
             (artifact_uuid,)
         ).fetchone()
 
         if not row:
             return []
 
-        data = json.loads(row["data"])
-        delta_uuids = data.get("deltas", [])
+        delta_uuids = json.loads(row["deltas"]) if row["deltas"] else []
+        prefixed_uuid = uid.add_core_prefix(artifact_uuid)
 
         # Return list with basic info
         # Full delta details would require Soil queries
         return [
             {
                 "delta_uuid": delta_id,
-                "artifact_uuid": uid.add_core_prefix(artifact_uuid),
+                "artifact_uuid": prefixed_uuid,
             }
             for delta_id in delta_uuids[-limit:]  # Most recent first
         ]
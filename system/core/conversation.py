@@ -17,12 +17,12 @@ BRANCHING NOTES:
 - No explicit 'branch' verb is needed
 """
 
-import json
 import sqlite3
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 
 from ..exceptions import ResourceNotFound
+from ..serialization import json_dumps, json_loads
 import utils.isodatetime as isodatetime
 from utils import uid
 
@@ -84,7 +84,8 @@ class ConversationOperations:
 
         Raises:
             ResourceNotFound: If ConversationLog doesn't exist
-            ValueError: If summary_content is empty
+            ValueError: If summary_content is empty, or the log's stored data
+                is not a JSON object
         """
         if not summary_content or not summary_content.strip():
             raise ValueError("Summary content cannot be empty")
@@ -92,22 +93,12 @@ class ConversationOperations:
         # Strip core_ prefix if present
         log_uuid = uid.strip_prefix(log_uuid)
 
-        # Verify ConversationLog exists
-        cursor = self._conn.execute(
-            "SELECT uuid, data, updated_at FROM entity WHERE uuid = ?",
-            (log_uuid,)
-        )
-        row = cursor.fetchone()
-
-        if row is None:
-            raise ResourceNotFound(f"ConversationLog not found: {log_uuid}")
-
-        # Parse existing data
-        data = json.loads(row["data"]) if row["data"] else {}
+        # One clock read stamps both the summary and the entity update
+        now = isodatetime.now()
 
         # Create summary object
         summary = {
-            "timestamp": isodatetime.now(),
+            "timestamp": now,
             "author": author,
             "content": summary_content,
         }
@@ -116,22 +107,35 @@ class ConversationOperations:
         if fragment_ids:
             summary["fragment_ids"] = fragment_ids
 
-        # Update data with summary and collapsed flag
-        data["summary"] = summary
-        data["collapsed"] = True
-
-        # Serialize updated data
-        updated_data_json = json.dumps(data)
-
-        # Update the entity
-        now = isodatetime.now()
-        self._conn.execute(
+        # Update data with summary and collapsed flag in place: json_set
+        # rewrites just these two keys, so the rest of the log data (e.g. a
+        # long items list) is never parsed or re-serialized in Python.
+        # Missing data starts from an empty object; anything else that is
+        # not a JSON object is left alone (json_set would fail or no-op).
+        cursor = self._conn.execute(
             """UPDATE entity
-               SET data = ?, updated_at = ?
-               WHERE uuid = ?""",
-            (updated_data_json, now, log_uuid)
+               SET data = json_set(CASE WHEN data IS NULL OR data = '' THEN '{}' ELSE data END,
+                                   '$.summary', json(?),
+                                   '$.collapsed', json('true')),
+                   updated_at = ?
+               WHERE uuid = ?
+                 AND (data IS NULL OR data = ''
+                      OR CASE WHEN json_valid(data) THEN json_type(data) END = 'object')""",
+            (json_dumps(summary), now, log_uuid)
         )
 
+        # No row updated: the ConversationLog doesn't exist, or its data
+        # can't take the summary
+        if cursor.rowcount == 0:
+            exists = self._conn.execute(
+                "SELECT 1 FROM entity WHERE uuid = ?", (log_uuid,)
+            ).fetchone()
+            if exists:
+                raise ValueError(
+                    f"ConversationLog {log_uuid} data is not a JSON object; cannot fold"
+                )
+            raise ResourceNotFound(f"ConversationLog not found: {log_uuid}")
+
         return FoldResult(
             log_uuid=uid.add_core_prefix(log_uuid),
             summary=summary,
@@ -170,7 +174,7 @@ class ConversationOperations:
         return {
             "uuid": uid.add_core_prefix(row["uuid"]),
             "_type": row["type"],
-            "data": json.loads(row["data"]) if row["data"] else {},
+            "data": json_loads(row["data"]) if row["data"] else {},
             "created_at": row["created_at"],
             "updated_at": row["updated_at"],
         }
@@ -28,6 +28,7 @@ CONNECTION LIFECYCLE (Session 6.5 Refactor):
 from typing import TYPE_CHECKING
 
 from ..exceptions import ResourceNotFound
+from ..serialization import json_dumps, json_loads
 from utils import hash_chain, uid
 import utils.isodatetime as isodatetime
 
@@ -36,6 +37,44 @@ if TYPE_CHECKING:
 
 import sqlite3
 
+_SQL_INSERT_ENTITY = """INSERT INTO entity (uuid, type, hash, previous_hash, version, group_id, derived_from, created_at, updated_at, data)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _new_entity_row(
+    entity_type: str,
+    data: dict | str | None,
+    group_id: str | None,
+    derived_from: str | None,
+) -> tuple:
+    """Build the _SQL_INSERT_ENTITY parameters for a new entity.
+
+    Generates the UUID, stamps created_at/updated_at, serializes data
+    (dict or JSON string, None for {}) and computes the initial hash.
+    """
+    entity_uuid = uid.generate_uuid()
+    now = isodatetime.now()
+
+    # Convert data to JSON string for storage
+    if data is None:
+        data_json = json_dumps({})
+    elif isinstance(data, dict):
+        data_json = json_dumps(data)
+    else:
+        data_json = data
+
+    # Compute initial hash (previous_hash is NULL for initial entities)
+    initial_hash = hash_chain.compute_entity_hash(
+        entity_type=entity_type,
+        created_at=now,
+        updated_at=now,
+        group_id=group_id,
+        derived_from=derived_from,
+        previous_hash=None,
+    )
+
+    return (entity_uuid, entity_type, initial_hash, None, 1, group_id, derived_from, now, now, data_json)
+
 
 class EntityOperations:
     """Entity registry operations with hash-based change tracking.
@@ -90,39 +129,13 @@ class EntityOperations:
         Raises:
             sqlite3.IntegrityError: If generated UUID already exists (extremely rare)
         """
-        import json
-
         # Generate UUID with collision retry
         max_retries = 3
         for attempt in range(max_retries):
-            entity_uuid = uid.generate_uuid()
-            now = isodatetime.now()
-
-            # Convert data to JSON string for storage
-            if data is None:
-                data_json = json.dumps({})
-            elif isinstance(data, dict):
-                data_json = json.dumps(data)
-            else:
-                data_json = data
-
-            # Compute initial hash (previous_hash is NULL for initial entities)
-            initial_hash = hash_chain.compute_entity_hash(
-                entity_type=entity_type,
-                created_at=now,
-                updated_at=now,
-                group_id=group_id,
-                derived_from=derived_from,
-                previous_hash=None,  # Initial entity has no previous hash
-            )
-
+            row = _new_entity_row(entity_type, data, group_id, derived_from)
             try:
-                self._conn.execute(
-                    """INSERT INTO entity (uuid, type, hash, previous_hash, version, group_id, derived_from, created_at, updated_at, data)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (entity_uuid, entity_type, initial_hash, None, 1, group_id, derived_from, now, now, data_json)
-                )
-                return entity_uuid
+                self._conn.execute(_SQL_INSERT_ENTITY, row)
+                return row[0]
             except sqlite3.IntegrityError:
                 # UUID collision - retry with new UUID
                 if attempt == max_retries - 1:
@@ -131,6 +144,39 @@ class EntityOperations:
         # Should never reach here
         raise RuntimeError("Failed to generate unique UUID after retries")
 
+    def create_many(
+        self,
+        entity_type: str,
+        data_list: list[dict | str | None],
+        group_id: str | None = None,
+        derived_from: str | None = None,
+    ) -> list[str]:
+        """Create several entities of one type with a single batched INSERT.
+
+        Same row contents as calling create() once per data item, but one
+        executemany instead of a statement per entity.
+
+        Args:
+            entity_type: The type of entity for every row
+            data_list: JSON data per entity (dict, JSON string, or None for {})
+            group_id: Optional group ID applied to every entity
+            derived_from: Optional source entity ID applied to every entity
+
+        Returns:
+            The auto-generated entity UUIDs (plain, no prefix), in input order
+
+        Raises:
+            sqlite3.IntegrityError: If a generated UUID already exists (extremely rare;
+                unlike create(), a batch is not retried)
+        """
+        # Per-row timestamps keep created_at ordering identical to create()
+        rows = [
+            _new_entity_row(entity_type, data, group_id, derived_from)
+            for data in data_list
+        ]
+        self._conn.executemany(_SQL_INSERT_ENTITY, rows)
+        return [row[0] for row in rows]
+
     def get_by_id(
         self,
         entity_id: str,
@@ -150,8 +196,6 @@ class EntityOperations:
         Raises:
             ResourceNotFound: If entity_id doesn't exist
         """
-        import json
-
         # Strip prefix if provided
         entity_id = uid.strip_prefix(entity_id)
 
@@ -174,7 +218,7 @@ class EntityOperations:
 
         # Parse JSON data to Python dict
         if entity.get('data'):
-            entity['data'] = json.loads(entity['data'])
+            entity['data'] = json_loads(entity['data'])
 
         return entity
 
@@ -288,10 +332,8 @@ class EntityOperations:
         Raises:
             ResourceNotFound: If entity_id doesn't exist
         """
-        import json
-
         entity_id = uid.strip_prefix(entity_id)
-        new_data = json.dumps(data)
+        new_data = json_dumps(data)
 
         # Update entity.data and timestamp
         self._conn.execute(
@@ -371,8 +413,6 @@ class EntityOperations:
         Returns:
             Tuple of (list of entity dicts with parsed JSON, total count)
         """
-        import json
-
         # Build WHERE clause
         where_parts = []
         params = []
@@ -405,7 +445,7 @@ class EntityOperations:
         for row in rows:
             entity = dict(row)
             if entity.get('data'):
-                entity['data'] = json.loads(entity['data'])
+                entity['data'] = json_loads(entity['data'])
             entities.append(entity)
 
         # Get total count
@@ -438,8 +478,6 @@ class EntityOperations:
             Only returns active entities (superseded_by IS NULL)
             Results ordered by updated_at DESC (most recent first)
         """
-        import json
-
         # Build search pattern with wildcards
         search_pattern = f"%{query}%"
 
@@ -478,7 +516,7 @@ class EntityOperations:
         for row in rows:
             entity = dict(row)
             if entity.get('data'):
-                entity['data'] = json.loads(entity['data'])
+                entity['data'] = json_loads(entity['data'])
             entities.append(entity)
 
         return entities
@@ -6,9 +6,35 @@ Implements fragment ID generation, reference parsing, and fragment resolution fo
 
 import hashlib
 import re
+from functools import lru_cache
 from typing import List, NamedTuple, Optional
 
 
+# Base36 alphabet for fragment IDs (see generate_fragment_id)
+_BASE36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+# Reference patterns (see parse_references), compiled once at import
+
+# Pattern for fragment references: ^<lowercase-alphanum> (exactly 3 chars)
+_FRAGMENT_REF_PATTERN = re.compile(r'\^([0-9a-z]{3})')
+
+# Pattern for artifact line refs: <label>:<line>[@<commit>]
+# Group 1: <label> (artifact identifier)
+# Group 2: :\d+ (line number)
+# Group 3: @hex (optional commit hash, 4+ characters)
+# The lookbehind skips starts after a letter/underscore (a match can only
+# begin at the start of a word run or right after a previous match's line
+# number), and the possessive label never backtracks; together they keep long
+# colon-free words linear instead of rescanning them from every position
+_ARTIFACT_LINE_REF_PATTERN = re.compile(r'(?<![^\W\d])([\w_]++):(\d+)(?:@([0-9a-f]{4,})\b)?')
+
+# Pattern for object refs: @<uuid> (Fact or Entity)
+_OBJECT_REF_PATTERN = re.compile(r'@((?:soil|core)_[\w-]+)')
+
+# Pattern for log refs: [<text>](uuid)
+_LOG_REF_PATTERN = re.compile(r'\[([^\]]+)\]\(((?:soil|core)_[\w-]+)\)')
+
+
 class NotImplementedError(Exception):
     """Fragment or artifact line resolution not yet implemented."""
     pass
@@ -43,6 +69,7 @@ class Fragment(NamedTuple):
     position: int  # Character position in Message content
 
 
+@lru_cache(maxsize=4096)
 def generate_fragment_id(content: str) -> str:
     """Generate exactly 3 character base36 hash from content (prefixed with ^).
 
@@ -65,6 +92,8 @@ def generate_fragment_id(content: str) -> str:
         - Convert first 2 bytes to base36 integer
         - Zero-pad to exactly 3 characters
         - Prefix with "^" character
+        - Memoized (LRU, 4096 entries): IDs are a pure function of content,
+          and the same snippets are fragmented repeatedly
     """
     # Hash the content
     hash_bytes = hashlib.sha256(content.encode()).digest()[:2]
@@ -72,19 +101,10 @@ def generate_fragment_id(content: str) -> str:
     # Convert to base36 integer
     hash_int = int.from_bytes(hash_bytes)
 
-    # Convert to base36 string (0-9, a-z)
-    characters = "0123456789abcdefghijklmnopqrstuvwxyz"
-    frag_id = ""
-    n = hash_int
-    if n == 0:
-        frag_id = "000"
-    else:
-        while n > 0:
-            frag_id = characters[n % 36] + frag_id
-            n = n // 36
-
-    # Zero-pad to exactly 3 characters, take only first 3
-    frag_id = frag_id[:3].zfill(3).lower()
+    # First 3 base36 digits (0-9, a-z), zero-padded. 2 bytes take at most
+    # 4 digits; with 4, the leading 3 are the digits of hash_int // 36
+    n = hash_int // 36 if hash_int >= 36 ** 3 else hash_int
+    frag_id = _BASE36_DIGITS[n // 1296] + _BASE36_DIGITS[n // 36 % 36] + _BASE36_DIGITS[n % 36]
 
     return f"^{frag_id}"
 
@@ -102,48 +122,39 @@ def parse_references(content: str) -> List[Reference]:
         List of parsed Reference objects with type, span, and target
 
     Implementation:
-        - Regex patterns for each reference type
+        - Regex patterns for each reference type (compiled once at import)
         - Return all non-overlapping matches in character offset order
     """
     references: List[Reference] = []
 
-    # Pattern for fragment references: ^<lowercase-alphanum> (exactly 3 chars)
-    frag_pattern = re.compile(r'\^([0-9a-z]{3})')
-
-    # Pattern for artifact line refs: <label>:<line>[@<commit>]
-    # Group 1: <label> (artifact identifier)
-    # Group 2: :\d+ (line number)
-    # Group 3: @hex (optional commit hash, 4+ characters)
-    artifact_line_pattern = re.compile(r'([\w_]+):(\d+)(?:@([0-9a-f]{4,})\b)?')
-
-    # Pattern for object refs: @<uuid> (Fact or Entity)
-    object_pattern = re.compile(r'@((?:soil|core)_[\w-]+)')
-
-    # Pattern for log refs: [<text>](uuid)
-    log_pattern = re.compile(r'\[([^\]]+)\]\(((?:soil|core)_[\w-]+)\)')
-
     # Find all matches
-    for match in frag_pattern.finditer(content):
-        ref_type = ReferenceType.FRAGMENT
-        references.append(Reference(ref_type, (match.start(), match.end()), match.group()))
-
-    for match in artifact_line_pattern.finditer(content):
-        # Check if this includes a commit hash (group 3)
-        if match.group(3):
-            ref_type_str = ReferenceType.ARTIFACT_LINE_AT_COMMIT
-        else:
-            ref_type_str = ReferenceType.ARTIFACT_LINE
-        references.append(Reference(ref_type_str, (match.start(), match.end()), match.group()))
-
-    for match in object_pattern.finditer(content):
-        ref_type = ReferenceType.OBJECT
-        # Extract just the UUID without @ prefix (group 1)
-        references.append(Reference(ref_type, (match.start(), match.end()), match.group(1)))
-
-    for match in log_pattern.finditer(content):
-        ref_type = ReferenceType.LOG
-        # Extract just the UUID without link syntax (group 2)
-        references.append(Reference(ref_type, (match.start(), match.end()), match.group(2)))
+    # Each scan is skipped when content lacks a character that every match of
+    # that pattern contains (a C-level substring check vs. a full regex pass)
+    if '^' in content:
+        for match in _FRAGMENT_REF_PATTERN.finditer(content):
+            ref_type = ReferenceType.FRAGMENT
+            references.append(Reference(ref_type, (match.start(), match.end()), match.group()))
+
+    if ':' in content:
+        for match in _ARTIFACT_LINE_REF_PATTERN.finditer(content):
+            # Check if this includes a commit hash (group 3)
+            if match.group(3):
+                ref_type_str = ReferenceType.ARTIFACT_LINE_AT_COMMIT
+            else:
+                ref_type_str = ReferenceType.ARTIFACT_LINE
+            references.append(Reference(ref_type_str, (match.start(), match.end()), match.group()))
+
+    if '@' in content:
+        for match in _OBJECT_REF_PATTERN.finditer(content):
+            ref_type = ReferenceType.OBJECT
+            # Extract just the UUID without @ prefix (group 1)
+            references.append(Reference(ref_type, (match.start(), match.end()), match.group(1)))
+
+    if '](' in content:
+        for match in _LOG_REF_PATTERN.finditer(content):
+            ref_type = ReferenceType.LOG
+            # Extract just the UUID without link syntax (group 2)
+            references.append(Reference(ref_type, (match.start(), match.end()), match.group(2)))
 
     return references
 
@@ -18,16 +18,19 @@ Context Resolution (RFC-004 Section 4.1):
 
 import os
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RuntimeContext:
     """Runtime context for MemoGarden deployment (RFC-004 Section 4.1).
 
     Contexts are determined by command verb, not auto-detection.
     Each verb has specific paths, signal method, and defaults.
+    Frozen, since resolve_context() hands the same instance to every caller;
+    slotted, so instances carry no per-instance __dict__.
 
     Attributes:
         verb: Command verb (serve, run, deploy)
@@ -102,6 +105,7 @@ class RuntimeContext:
         )
 
 
+@cache
 def resolve_context(
     verb: str,
     config_override: Optional[Path] = None
@@ -118,6 +122,11 @@ def resolve_context(
     Raises:
         ValueError: If verb is not one of: serve, run, deploy
 
+    Note:
+        Memoized per (verb, config_override): contexts only depend on those
+        and the home directory. Call resolve_context.cache_clear() after
+        changing HOME.
+
     Examples:
         >>> # System daemon context
         >>> ctx = resolve_context("serve")
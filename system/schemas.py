@@ -26,9 +26,14 @@ USAGE:
 
 from __future__ import annotations
 
+import copy
 import json
+import re
+from functools import lru_cache
 from pathlib import Path
 
+from .serialization import json_loads
+
 # Try importlib.resources for bundled package support (Python 3.13)
 try:
     from importlib.resources import files as resource_files
@@ -41,8 +46,8 @@ except ImportError:
 # CONSTANTS
 # ============================================================================
 
-VALID_LAYERS = {"soil", "core"}
-VALID_CATEGORIES = {"facts", "entities"}
+VALID_LAYERS = frozenset({"soil", "core"})
+VALID_CATEGORIES = frozenset({"facts", "entities"})
 
 # Schema file paths (relative to package root)
 SQL_SCHEMA_PATHS = {
@@ -55,6 +60,15 @@ TYPE_SCHEMA_DIR = {
     "entities": "system/schemas/types/entities",
 }
 
+# Development-mode schema directories, resolved once at import
+_PACKAGE_SCHEMA_DIR = Path(__file__).parent / "schemas"
+_REPO_SCHEMA_DIR = Path(__file__).parent.parent / "schemas"
+_WORKSPACE_SCHEMA_DIR = Path(__file__).parent.parent.parent / "schemas"
+
+# First "title" string in a type schema (the top-level one when it comes
+# before any nested object, as it does by convention after $schema/$id)
+_TITLE_RE = re.compile(rb'"title"\s*:\s*"([^"]+)"')
+
 
 # ============================================================================
 # SQL SCHEMA ACCESS
@@ -82,7 +96,12 @@ def get_sql_schema(layer: str) -> str:
             f"Invalid layer: {layer!r}. Must be one of: {sorted(VALID_LAYERS)}"
         )
 
-    schema_path = SQL_SCHEMA_PATHS[layer]
+    return _load_sql_schema(layer)
+
+
+@lru_cache(maxsize=None)
+def _load_sql_schema(layer: str) -> str:
+    """Read a SQL schema file (cached; schemas are bundled package data)."""
 
     # Try importlib.resources first (bundled package)
     if HAS_RESOURCE_FILES:
@@ -97,8 +116,8 @@ def get_sql_schema(layer: str) -> str:
     # Fall back to file reading (development mode)
     # Try system package location first, then root location
     file_locations = [
-        Path(__file__).parent / "schemas" / "sql" / f"{layer}.sql",
-        Path(__file__).parent.parent.parent / "schemas" / "sql" / f"{layer}.sql",
+        _PACKAGE_SCHEMA_DIR / "sql" / f"{layer}.sql",
+        _WORKSPACE_SCHEMA_DIR / "sql" / f"{layer}.sql",
     ]
 
     for file_path in file_locations:
@@ -139,8 +158,20 @@ def get_type_schema(category: str, type_name: str) -> dict:
             f"Invalid category: {category!r}. Must be one of: {sorted(VALID_CATEGORIES)}"
         )
 
+    # Parsed once per type; callers get their own copy to mutate freely
+    return copy.deepcopy(_load_type_schema(category, type_name.lower()))
+
+
+@lru_cache(maxsize=None)
+def _load_type_schema(category: str, type_name: str) -> dict:
+    """Read and parse a type schema file (cached; do not mutate the result).
+
+    Args:
+        category: Validated schema category
+        type_name: Lowercase type name
+    """
     # Schema filename uses lowercase type name
-    schema_filename = f"{type_name.lower()}.schema.json"
+    schema_filename = f"{type_name}.schema.json"
 
     # Try importlib.resources first (bundled package)
     if HAS_RESOURCE_FILES:
@@ -154,22 +185,22 @@ def get_type_schema(category: str, type_name: str) -> dict:
             )
             if schema_file.is_file():
                 content = schema_file.read_text(encoding="utf-8")
-                return json.loads(content)
+                return json_loads(content)
         except (FileNotFoundError, AttributeError, json.JSONDecodeError):
             # Fall through to file reading
             pass
 
     # Fall back to file reading (development mode)
     file_locations = [
-        Path(__file__).parent / "schemas" / "types" / category / schema_filename,
-        Path(__file__).parent.parent.parent / "schemas" / "types" / category / schema_filename,
+        _PACKAGE_SCHEMA_DIR / "types" / category / schema_filename,
+        _WORKSPACE_SCHEMA_DIR / "types" / category / schema_filename,
     ]
 
     for file_path in file_locations:
         if file_path.exists():
             content = file_path.read_text(encoding="utf-8")
             try:
-                return json.loads(content)
+                return json_loads(content)
             except json.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON in schema file {file_path}: {e}") from e
 
@@ -202,6 +233,16 @@ def list_type_schemas(category: str) -> list[str]:
             f"Invalid category: {category!r}. Must be one of: {sorted(VALID_CATEGORIES)}"
         )
 
+    return list(_scan_type_schemas(category))
+
+
+@lru_cache(maxsize=None)
+def _scan_type_schemas(category: str) -> tuple[str, ...]:
+    """Scan schema directories for a category and return sorted type names.
+
+    Cached per category: schema files are bundled package data and do not
+    change during the lifetime of the process.
+    """
     type_names: set[str] = set()
 
     # Try importlib.resources first (bundled package)
@@ -211,42 +252,21 @@ def list_type_schemas(category: str) -> list[str]:
             if schema_dir.is_dir():
                 for item in schema_dir.iterdir():
                     if item.is_file() and item.name.endswith(".schema.json"):
-                        # Read schema to get the correct title from the JSON
-                        try:
-                            content = item.read_text(encoding="utf-8")
-                            schema = json.loads(content)
-                            if 'title' in schema:
-                                type_names.add(schema['title'])
-                        except (json.JSONDecodeError, UnicodeDecodeError):
-                            # Fallback to filename-based extraction
-                            type_name = item.name.removesuffix(".schema.json")
-                            type_names.add(type_name.title())
+                        type_names.add(_read_schema_title(item))
         except (FileNotFoundError, AttributeError):
             # Fall through to file reading
             pass
 
     # Fall back to file reading (development mode)
     file_locations = [
-        Path(__file__).parent / "schemas" / "types" / category,
-        Path(__file__).parent.parent / "schemas" / "types" / category,
+        _PACKAGE_SCHEMA_DIR / "types" / category,
+        _REPO_SCHEMA_DIR / "types" / category,
     ]
 
     for dir_path in file_locations:
         if dir_path.exists() and dir_path.is_dir():
             for schema_file in dir_path.glob("*.schema.json"):
-                # Try to read schema to get the correct title
-                try:
-                    content = schema_file.read_text(encoding="utf-8")
-                    schema = json.loads(content)
-                    if 'title' in schema:
-                        type_names.add(schema['title'])
-                        continue
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    pass
-
-                # Fallback to filename-based extraction
-                type_name = schema_file.stem.removesuffix(".schema")
-                type_names.add(type_name.title())
+                type_names.add(_read_schema_title(schema_file))
 
     if not type_names:
         raise FileNotFoundError(
@@ -254,4 +274,43 @@ def list_type_schemas(category: str) -> list[str]:
             f"Searched locations: {[str(p) for p in file_locations]}"
         )
 
-    return sorted(type_names)
+    return tuple(sorted(type_names))
+
+
+def _read_schema_title(schema_file) -> str:
+    """Get the type name declared by a schema file.
+
+    Scans the raw bytes for the first "title" string and uses it when it
+    precedes every nested object (so it belongs to the top-level schema)
+    and holds no JSON escapes. Otherwise the file is fully parsed and its
+    top-level "title" used. Files without one use the filename
+    (e.g., 'note.schema.json' -> 'Note').
+
+    Args:
+        schema_file: Path or importlib.resources Traversable for the schema
+
+    Returns:
+        Type name from the schema title or filename
+    """
+    content = schema_file.read_bytes()
+
+    match = _TITLE_RE.search(content)
+    if (
+        match
+        and content.count(b"{", 0, match.start()) == 1
+        and b"\\" not in match.group(1)
+    ):
+        try:
+            return match.group(1).decode("utf-8")
+        except UnicodeDecodeError:
+            pass
+
+    try:
+        schema = json_loads(content.decode("utf-8"))
+        if isinstance(schema, dict) and 'title' in schema:
+            return schema['title']
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        pass
+
+    # Fallback to filename-based extraction
+    return schema_file.name.removesuffix(".schema.json").title()
@@ -54,7 +54,8 @@ CREATE TABLE IF NOT EXISTS entity (
 
 CREATE INDEX IF NOT EXISTS idx_entity_type ON entity(type);
 CREATE INDEX IF NOT EXISTS idx_entity_hash ON entity(hash);
-CREATE INDEX IF NOT EXISTS idx_entity_previous_hash ON entity(previous_hash);
+-- uuid included so the broken-chain check (_find_broken_hash_chains) scans this index only
+CREATE INDEX IF NOT EXISTS idx_entity_previous_hash ON entity(previous_hash, uuid);
 CREATE INDEX IF NOT EXISTS idx_entity_updated ON entity(updated_at);
 
 -- ============================================================================
@@ -23,6 +23,10 @@ INSERT OR IGNORE INTO _schema_metadata VALUES
     ('description', 'Soil base tables only; type schemas in JSON', datetime('now')),
     ('epoch_date', '2020-01-01', datetime('now'));
 
+-- Mirrors the 'version' row above as an integer in the database header,
+-- so initialization can be checked without querying _schema_metadata
+PRAGMA user_version = 20260130;
+
 -- ============================================================================
 -- ITEM TABLE (Polymorphic timeline with JSON data)
 -- ============================================================================
@@ -49,6 +53,11 @@ CREATE INDEX IF NOT EXISTS idx_item_realized ON item(realized_at);
 CREATE INDEX IF NOT EXISTS idx_item_canonical ON item(canonical_at);
 CREATE INDEX IF NOT EXISTS idx_item_fidelity ON item(fidelity);
 
+-- Email dedup lookup by RFC Message-ID (find_item_by_rfc_message_id)
+CREATE INDEX IF NOT EXISTS idx_item_rfc_message_id
+    ON item(json_extract(data, '$.rfc_message_id'))
+    WHERE _type = 'Email';
+
 -- ============================================================================
 -- SYSTEM RELATION TABLE (Immutable structural facts)
 -- ============================================================================
@@ -65,7 +74,7 @@ CREATE TABLE IF NOT EXISTS system_relation (
     metadata JSON,
     
     UNIQUE(kind, source, target)
-);
+) WITHOUT ROWID;                        -- narrow rows keyed by uuid: the PK index is the table
 
 CREATE INDEX IF NOT EXISTS idx_sysrel_source ON system_relation(source);
 CREATE INDEX IF NOT EXISTS idx_sysrel_target ON system_relation(target);
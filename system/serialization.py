@@ -0,0 +1,64 @@
+"""JSON serialization for database storage.
+
+Writes always go through the stdlib json module with its default settings,
+the same text Core writes with json.dumps, so Soil and Core JSON columns
+share one stored format regardless of which optional packages are installed.
+
+Reads use orjson when installed (several times faster than stdlib json) and
+the stdlib json module otherwise, with identical results. orjson is not a
+drop-in replacement, so json_loads falls back to stdlib json for:
+- NaN/Infinity literals (written by json.dumps for non-finite floats),
+  which orjson rejects.
+- Any run of 19 or more digits, since orjson reads integers outside the
+  64-bit range as floats. The check is a single regex scan; text that
+  only has long digit runs inside strings takes the slower path too.
+orjson is not used for writing because its output differs from json.dumps:
+compact separators, unescaped non-ASCII, NaN/Infinity written as null and
+integers above 64 bits rejected.
+
+NOTE: Integrity hashes (Fact.compute_hash, utils.hash_chain) keep using
+stdlib json directly - their canonical form must not change.
+
+USAGE:
+    >>> from system.serialization import json_dumps, json_loads
+    >>> json_dumps({"a": 1})
+    '{"a": 1}'
+    >>> json_loads('{"a": 1}')
+    {'a': 1}
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+# Optional accelerated backend
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize obj to JSON text in the stored format (stdlib json.dumps)."""
+    return json.dumps(obj)
+
+
+if HAS_ORJSON:
+    # Digit runs long enough to hold an integer orjson cannot read exactly
+    # (any integer of 18 or fewer digits fits in 64 bits)
+    _LONG_DIGITS = re.compile(r"\d{19}")
+
+    def json_loads(s: str) -> Any:
+        """Deserialize JSON text (orjson backend, stdlib where orjson would differ)."""
+        if _LONG_DIGITS.search(s):
+            return json.loads(s)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # Also raises json.JSONDecodeError for genuinely invalid text
+            return json.loads(s)
+else:
+    json_loads = json.loads
@@ -15,7 +15,7 @@ All UUIDs are auto-generated UUIDv4 with "soil_" prefix.
 
 from .fact import Fact, Evidence, generate_soil_uuid, SOIL_UUID_PREFIX, current_day
 from .relation import SystemRelation
-from .database import Soil, get_soil, create_email_item
+from .database import Soil, get_soil, create_email_item, close_shared_connections
 
 __all__ = [
     "Fact",
@@ -27,4 +27,5 @@ __all__ = [
     "current_day",
     "get_soil",
     "create_email_item",
+    "close_shared_connections",
 ]
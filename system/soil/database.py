@@ -2,15 +2,135 @@
 
 from __future__ import annotations
 
-import json
+import atexit
 import sqlite3
+import threading
 from datetime import UTC
 from pathlib import Path
 
-from .fact import SOIL_UUID_PREFIX, Evidence, Fact, current_day, generate_soil_uuid
+from ..serialization import json_dumps, json_loads
+from .fact import FACT_COLUMNS, SOIL_UUID_PREFIX, Evidence, Fact, current_day, generate_soil_uuid
 from .relation import SystemRelation
 
 
+# ============================================================================
+# SQL STATEMENTS
+# ============================================================================
+# Built once at import so every call passes the identical string to
+# sqlite3's prepared-statement cache.
+
+# Per-connection prepared-statement cache (sqlite3 default is 128)
+_STATEMENT_CACHE_SIZE = 256
+
+_SQL_GET_SCHEMA_VERSION = "SELECT value FROM _schema_metadata WHERE key = 'version'"
+
+_SQL_GET_USER_VERSION = "PRAGMA user_version"
+
+_SQL_INSERT_ITEM = """INSERT INTO item (uuid, _type, realized_at, canonical_at, integrity_hash,
+                              fidelity, superseded_by, superseded_at, data, metadata)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_SQL_GET_ITEM = f"SELECT {FACT_COLUMNS} FROM item WHERE uuid = ?"
+
+_SQL_ITEM_EXISTS = "SELECT 1 FROM item WHERE uuid = ? LIMIT 1"
+
+_SQL_MARK_SUPERSEDED = """UPDATE item
+               SET superseded_by = ?, superseded_at = ?
+               WHERE uuid = ?"""
+
+_SQL_FIND_BY_RFC_MESSAGE_ID = f"""SELECT {FACT_COLUMNS} FROM item
+               WHERE _type = 'Email'
+               AND json_extract(data, '$.rfc_message_id') = ?"""
+
+_SQL_LIST_ITEMS_BY_TYPE = f"SELECT {FACT_COLUMNS} FROM item WHERE _type = ? ORDER BY realized_at DESC LIMIT ?"
+
+_SQL_LIST_ITEMS = f"SELECT {FACT_COLUMNS} FROM item ORDER BY realized_at DESC LIMIT ?"
+
+_SQL_COUNT_ITEMS_BY_TYPE = "SELECT COUNT(*) FROM item WHERE _type = ?"
+
+_SQL_COUNT_ITEMS = "SELECT COUNT(*) FROM item"
+
+_SQL_INSERT_RELATION = """INSERT OR IGNORE INTO system_relation (uuid, kind, source, source_type, target,
+                                              target_type, created_at, evidence, metadata)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# (kind, source, target) keys per UUID-recovery SELECT; 3 params each keeps
+# the statement under SQLite's historical 999 bound-parameter limit
+_RELATION_LOOKUP_BATCH = 300
+
+_SQL_COUNT_RELATIONS_BY_KIND = "SELECT COUNT(*) FROM system_relation WHERE kind = ?"
+
+_SQL_COUNT_RELATIONS = "SELECT COUNT(*) FROM system_relation"
+
+
+def _with_soil_prefix(uuid: str) -> str:
+    """Return uuid with the soil_ prefix, adding it only when missing."""
+    return uuid if uuid.startswith(SOIL_UUID_PREFIX) else SOIL_UUID_PREFIX + uuid
+
+
+def _fact_row_factory(cursor: sqlite3.Cursor, row: tuple) -> Fact:
+    """sqlite3 row factory building Facts from FACT_COLUMNS rows."""
+    return Fact.from_row(row)
+
+
+def _connect(db_path: str | Path) -> sqlite3.Connection:
+    """Open and configure a Soil connection."""
+    # Detect if db_path is a SQLite URI
+    is_uri = isinstance(db_path, str) and db_path.startswith("file:")
+
+    # Use uri=True for URI paths
+    conn = sqlite3.connect(
+        db_path if is_uri else str(db_path),
+        uri=is_uri,
+        cached_statements=_STATEMENT_CACHE_SIZE,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    # Under WAL, synchronous=NORMAL skips the fsync on each commit. The
+    # database cannot be corrupted, but the most recent commits may be lost
+    # on power failure or OS crash (they survive an application crash).
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA cache_size = -65536")  # 64 MB page cache
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")  # 256 MB
+    return conn
+
+
+# Long-lived connections for Soil(shared=True), per thread and db_path
+# (sqlite3 connections must stay on the thread that created them)
+_shared = threading.local()
+
+
+def _get_shared_connection(db_path: str | Path) -> sqlite3.Connection:
+    """Get this thread's long-lived connection for db_path, opening it once."""
+    connections = getattr(_shared, "connections", None)
+    if connections is None:
+        connections = _shared.connections = {}
+    key = str(db_path)
+    conn = connections.get(key)
+    if conn is None:
+        conn = connections[key] = _connect(db_path)
+        # No implicit BEGIN: Soil's SAVEPOINTs are the only transaction control
+        conn.isolation_level = None
+    return conn
+
+
+def close_shared_connections() -> None:
+    """Close the calling thread's shared Soil connections.
+
+    Registered with atexit for the main thread; worker threads that used
+    Soil(shared=True) should call this before exiting.
+    """
+    connections = getattr(_shared, "connections", None)
+    while connections:
+        _, conn = connections.popitem()
+        conn.close()
+
+
+atexit.register(close_shared_connections)
+
+
 class Soil:
     """Soil database for immutable Facts and System Relations.
 
@@ -19,13 +139,25 @@ class Soil:
     - __enter__: Marks Soil as active, creates connection, returns self
     - __exit__: Commits on success, rollbacks on exception, always closes
     - Operations call _get_connection() which raises RuntimeError if not in context
+
+    SHARED CONNECTIONS (shared=True):
+    - Reuses a long-lived per-thread connection for db_path instead of
+      opening (and re-issuing PRAGMAs) per with-block
+    - __enter__ opens a SAVEPOINT; __exit__ releases it on success or
+      rolls back to it on exception; the connection stays open until
+      close_shared_connections() (registered with atexit)
+    - init_schema() commits everything pending on the shared connection,
+      including enclosing with-blocks, then reopens this block's SAVEPOINT
+    - Not for use with CrossDatabaseTransaction, which issues its own BEGIN
     """
 
-    def __init__(self, db_path: str | Path = "soil.db"):
+    def __init__(self, db_path: str | Path = "soil.db", shared: bool = False):
         """Initialize Soil database.
 
         Args:
             db_path: Path to SQLite database file or SQLite URI connection string
+            shared: If True, scope each with-block as a SAVEPOINT on a
+                long-lived per-thread connection
 
         Note:
             Soil must be used as context manager. Operations will raise
@@ -36,6 +168,11 @@ class Soil:
             self.db_path = db_path  # Keep URI as string
         else:
             self.db_path = Path(db_path)
+            # Create parent directory once per instance, not per connection
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._shared = shared
+        self._savepoint = f"soil_{id(self):x}"
+        self._outermost = False  # Shared: this context's SAVEPOINT began the transaction
         self._conn: sqlite3.Connection | None = None
         self._in_context = False  # Track if we're inside a context manager
 
@@ -54,27 +191,18 @@ class Soil:
                 "Use: with get_soil() as soil: ..."
             )
         if self._conn is None:
-            # Detect if db_path is a SQLite URI
-            is_uri = isinstance(self.db_path, str) and self.db_path.startswith("file:")
-
-            # Only create parent directory if not a URI path
-            if not is_uri:
-                self.db_path.parent.mkdir(parents=True, exist_ok=True)
-                db_path = str(self.db_path)
+            if self._shared:
+                self._conn = _get_shared_connection(self.db_path)
             else:
-                db_path = self.db_path  # Use URI as-is
-
-            # Use uri=True for URI paths
-            self._conn = sqlite3.connect(db_path, uri=is_uri)
-            self._conn.row_factory = sqlite3.Row
-            self._conn.execute("PRAGMA foreign_keys = ON")
-            self._conn.execute("PRAGMA journal_mode = WAL")
+                # Parent directory is created in __init__ for file paths
+                self._conn = _connect(self.db_path)
         return self._conn
 
     def close(self):
-        """Close database connection."""
+        """Close database connection (shared connections are only detached)."""
         if self._conn:
-            self._conn.close()
+            if not self._shared:
+                self._conn.close()
             self._conn = None
 
     def __enter__(self) -> Soil:
@@ -84,7 +212,10 @@ class Soil:
             self for use in with-statement
         """
         self._in_context = True
-        self._get_connection()  # Ensure connection is created
+        conn = self._get_connection()  # Ensure connection is created
+        if self._shared:
+            self._outermost = not conn.in_transaction
+            conn.execute(f"SAVEPOINT {self._savepoint}")
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -97,7 +228,9 @@ class Soil:
         """
         self._in_context = False
         try:
-            if self._conn is not None:  # Only commit/rollback if connection exists
+            if self._shared:
+                self._exit_savepoint(exc_type is None)
+            elif self._conn is not None:  # Only commit/rollback if connection exists
                 if exc_type is None:
                     # No exception - commit the transaction
                     self._conn.commit()
@@ -108,6 +241,28 @@ class Soil:
             # Always close connection
             self.close()
 
+    def _exit_savepoint(self, success: bool):
+        """Release (or roll back and release) this context's SAVEPOINT."""
+        conn = self._conn
+        if conn is None:
+            return
+        try:
+            if conn.in_transaction:
+                if not success:
+                    conn.execute(f"ROLLBACK TO {self._savepoint}")
+                conn.execute(f"RELEASE {self._savepoint}")
+        finally:
+            # Releasing the outermost SAVEPOINT commits; if that failed, never
+            # leave the long-lived connection inside an open transaction
+            if self._outermost and conn.in_transaction:
+                conn.rollback()
+
+    def _fact_cursor(self) -> sqlite3.Cursor:
+        """Get a cursor that hydrates FACT_COLUMNS rows directly into Facts."""
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = _fact_row_factory
+        return cursor
+
     # ==========================================================================
     # INITIALIZATION
     # ==========================================================================
@@ -130,17 +285,31 @@ class Soil:
             ) from e
 
         conn = self._get_connection()
+        # executescript() commits any pending transaction first
         conn.executescript(schema_sql)
-        conn.commit()
+        if self._shared:
+            # That commit ended this context's SAVEPOINT; open it again so
+            # later writes stay scoped to the with-block
+            conn.execute(f"SAVEPOINT {self._savepoint}")
+            self._outermost = True
+        else:
+            conn.commit()
 
     def get_schema_version(self) -> str | None:
         """Get current schema version."""
-        cursor = self._get_connection().execute(
-            "SELECT value FROM _schema_metadata WHERE key = 'version'"
-        )
+        cursor = self._get_connection().execute(_SQL_GET_SCHEMA_VERSION)
         row = cursor.fetchone()
         return row[0] if row else None
 
+    def is_initialized(self) -> bool:
+        """Check whether init_schema() has run on this database.
+
+        Reads PRAGMA user_version (set by soil.sql) from the database
+        header instead of querying _schema_metadata.
+        """
+        cursor = self._get_connection().execute(_SQL_GET_USER_VERSION)
+        return cursor.fetchone()[0] != 0
+
     # ==========================================================================
     # ITEM OPERATIONS
     # ==========================================================================
@@ -154,16 +323,27 @@ class Soil:
         Returns:
             UUID of created Fact
         """
-        # Compute hash if not provided
-        if fact.integrity_hash is None:
-            fact.integrity_hash = fact.compute_hash()
+        return self.create_facts([fact])[0]
 
-        conn = self._get_connection()
-        conn.execute(
-            """INSERT INTO item (uuid, _type, realized_at, canonical_at, integrity_hash,
-                              fidelity, superseded_by, superseded_at, data, metadata)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
+    def create_facts(self, facts: list[Fact]) -> list[str]:
+        """Create multiple Facts in Soil with a single batched INSERT.
+
+        Use for bulk imports (e.g., email sync) to avoid per-row
+        statement overhead.
+
+        Args:
+            facts: Facts to create
+
+        Returns:
+            UUIDs of created Facts, in input order
+        """
+        rows = []
+        for fact in facts:
+            # Compute hash if not provided, from the data as stored now
+            if fact.integrity_hash is None:
+                fact.integrity_hash = fact.recompute_hash()
+
+            rows.append((
                 fact.uuid,
                 fact._type,
                 fact.realized_at,
@@ -172,11 +352,13 @@ class Soil:
                 fact.fidelity,
                 fact.superseded_by,
                 fact.superseded_at,
-                json.dumps(fact.data),
-                json.dumps(fact.metadata) if fact.metadata else None,
-            )
-        )
-        return fact.uuid
+                json_dumps(fact.data),
+                json_dumps(fact.metadata) if fact.metadata else None,
+            ))
+
+        conn = self._get_connection()
+        conn.executemany(_SQL_INSERT_ITEM, rows)
+        return [fact.uuid for fact in facts]
 
     def get_fact(self, uuid: str) -> Fact | None:
         """Get Fact by UUID.
@@ -188,29 +370,16 @@ class Soil:
             Fact if found, None otherwise
         """
         # Ensure prefix
-        if not uuid.startswith(SOIL_UUID_PREFIX):
-            uuid = f"{SOIL_UUID_PREFIX}{uuid}"
-
-        cursor = self._get_connection().execute(
-            "SELECT * FROM item WHERE uuid = ?", (uuid,)
-        )
-        row = cursor.fetchone()
+        uuid = _with_soil_prefix(uuid)
 
-        if row is None:
-            return None
+        cursor = self._fact_cursor().execute(_SQL_GET_ITEM, (uuid,))
+        return cursor.fetchone()
 
-        return Fact(
-            uuid=row["uuid"],
-            _type=row["_type"],
-            realized_at=row["realized_at"],
-            canonical_at=row["canonical_at"],
-            integrity_hash=row["integrity_hash"],
-            fidelity=row["fidelity"],
-            superseded_by=row["superseded_by"],
-            superseded_at=row["superseded_at"],
-            data=json.loads(row["data"]),
-            metadata=json.loads(row["metadata"]) if row["metadata"] else None,
-        )
+    def _exists_item(self, uuid: str) -> bool:
+        """Check whether a Fact exists without fetching or decoding its row."""
+        uuid = _with_soil_prefix(uuid)
+        cursor = self._get_connection().execute(_SQL_ITEM_EXISTS, (uuid,))
+        return cursor.fetchone() is not None
 
     def mark_superseded(self, original_uuid: str, superseded_by_uuid: str, superseded_at: str) -> bool:
         """Mark a Fact as superseded by another Fact.
@@ -227,16 +396,12 @@ class Soil:
             True if Fact was found and updated, False if not found
         """
         # Ensure UUIDs have prefix
-        if not original_uuid.startswith(SOIL_UUID_PREFIX):
-            original_uuid = f"{SOIL_UUID_PREFIX}{original_uuid}"
-        if not superseded_by_uuid.startswith(SOIL_UUID_PREFIX):
-            superseded_by_uuid = f"{SOIL_UUID_PREFIX}{superseded_by_uuid}"
+        original_uuid = _with_soil_prefix(original_uuid)
+        superseded_by_uuid = _with_soil_prefix(superseded_by_uuid)
 
         conn = self._get_connection()
         cursor = conn.execute(
-            """UPDATE item
-               SET superseded_by = ?, superseded_at = ?
-               WHERE uuid = ?""",
+            _SQL_MARK_SUPERSEDED,
             (superseded_by_uuid, superseded_at, original_uuid)
         )
         return cursor.rowcount > 0
@@ -250,29 +415,8 @@ class Soil:
         Returns:
             Email Fact if found, None otherwise
         """
-        cursor = self._get_connection().execute(
-            """SELECT * FROM item
-               WHERE _type = 'Email'
-               AND json_extract(data, '$.rfc_message_id') = ?""",
-            (message_id,)
-        )
-        row = cursor.fetchone()
-
-        if row is None:
-            return None
-
-        return Fact(
-            uuid=row["uuid"],
-            _type=row["_type"],
-            realized_at=row["realized_at"],
-            canonical_at=row["canonical_at"],
-            integrity_hash=row["integrity_hash"],
-            fidelity=row["fidelity"],
-            superseded_by=row["superseded_by"],
-            superseded_at=row["superseded_at"],
-            data=json.loads(row["data"]),
-            metadata=json.loads(row["metadata"]) if row["metadata"] else None,
-        )
+        cursor = self._fact_cursor().execute(_SQL_FIND_BY_RFC_MESSAGE_ID, (message_id,))
+        return cursor.fetchone()
 
     def list_items(self, _type: str | None = None, limit: int = 100) -> list[Fact]:
         """List Facts, optionally filtered by type.
@@ -284,32 +428,13 @@ class Soil:
         Returns:
             List of Facts
         """
+        cursor = self._fact_cursor()
         if _type:
-            cursor = self._get_connection().execute(
-                """SELECT * FROM item WHERE _type = ? ORDER BY realized_at DESC LIMIT ?""",
-                (_type, limit)
-            )
+            cursor.execute(_SQL_LIST_ITEMS_BY_TYPE, (_type, limit))
         else:
-            cursor = self._get_connection().execute(
-                """SELECT * FROM item ORDER BY realized_at DESC LIMIT ?""",
-                (limit,)
-            )
+            cursor.execute(_SQL_LIST_ITEMS, (limit,))
 
-        items = []
-        for row in cursor.fetchall():
-            items.append(Fact(
-                uuid=row["uuid"],
-                _type=row["_type"],
-                realized_at=row["realized_at"],
-                canonical_at=row["canonical_at"],
-                integrity_hash=row["integrity_hash"],
-                fidelity=row["fidelity"],
-                superseded_by=row["superseded_by"],
-                superseded_at=row["superseded_at"],
-                data=json.loads(row["data"]),
-                metadata=json.loads(row["metadata"]) if row["metadata"] else None,
-            ))
-        return items
+        return cursor.fetchall()
 
     def search_items(
         self,
@@ -383,44 +508,68 @@ class Soil:
         Returns:
             UUID of created relation
         """
-        # Convert Evidence to dict if needed
-        evidence_data = None
-        if relation.evidence:
-            if isinstance(relation.evidence, Evidence):
-                evidence_data = relation.evidence.to_dict()
-            else:
-                evidence_data = relation.evidence
+        return self.create_relations([relation])[0]
 
-        conn = self._get_connection()
-        try:
-            conn.execute(
-                """INSERT INTO system_relation (uuid, kind, source, source_type, target, target_type,
-                                              created_at, evidence, metadata)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    relation.uuid,
-                    relation.kind,
-                    relation.source,
-                    relation.source_type,
-                    relation.target,
-                    relation.target_type,
-                    relation.created_at,
-                    json.dumps(evidence_data) if evidence_data else None,
-                    json.dumps(relation.metadata) if relation.metadata else None,
-                )
+    def create_relations(self, relations: list[SystemRelation]) -> list[str]:
+        """Create multiple System Relations in one batch.
+
+        Relations that already exist (unique constraint on kind, source,
+        target) are skipped and the existing relation's UUID is returned
+        in their place.
+
+        Args:
+            relations: SystemRelations to create
+
+        Returns:
+            UUIDs of the created (or pre-existing) relations, in input order
+        """
+        # Evidence/metadata objects are often shared across a batch;
+        # serialize each distinct object once (keyed by id(); the objects
+        # stay alive in `relations` meanwhile)
+        serialized: dict[int, str] = {}
+
+        def dumps(obj):
+            if not obj:
+                return None
+            key = id(obj)
+            if key not in serialized:
+                # Convert Evidence to dict if needed
+                serialized[key] = json_dumps(obj.to_dict() if isinstance(obj, Evidence) else obj)
+            return serialized[key]
+
+        rows = [
+            (
+                relation.uuid,
+                relation.kind,
+                relation.source,
+                relation.source_type,
+                relation.target,
+                relation.target_type,
+                relation.created_at,
+                dumps(relation.evidence),
+                dumps(relation.metadata),
             )
-        except sqlite3.IntegrityError:
-            # Relation already exists (unique constraint on kind, source, target)
-            # Fetch existing relation's UUID
+            for relation in relations
+        ]
+
+        conn = self._get_connection()
+        conn.executemany(_SQL_INSERT_RELATION, rows)
+
+        # Recover stored UUIDs (pre-existing rows keep their original UUID)
+        keys = [(r.kind, r.source, r.target) for r in relations]
+        stored: dict[tuple[str, str, str], str] = {}
+        for i in range(0, len(keys), _RELATION_LOOKUP_BATCH):
+            batch = keys[i:i + _RELATION_LOOKUP_BATCH]
+            placeholders = ", ".join(["(?, ?, ?)"] * len(batch))
             cursor = conn.execute(
-                """SELECT uuid FROM system_relation
-                   WHERE kind = ? AND source = ? AND target = ?""",
-                (relation.kind, relation.source, relation.target)
+                f"""SELECT kind, source, target, uuid FROM system_relation
+                   WHERE (kind, source, target) IN (VALUES {placeholders})""",
+                [value for key in batch for value in key]
             )
-            row = cursor.fetchone()
-            return row[0] if row else relation.uuid
+            for kind, source, target, uuid in cursor:
+                stored[(kind, source, target)] = uuid
 
-        return relation.uuid
+        return [stored.get(key, relation.uuid) for key, relation in zip(keys, relations)]
 
     def create_replies_to_relation(
         self,
@@ -438,8 +587,7 @@ class Soil:
         Returns:
             UUID of created relation, or None if parent not found
         """
-        parent = self.get_fact(parent_uuid)
-        if parent is None:
+        if not self._exists_item(parent_uuid):
             return None
 
         relation = SystemRelation(
@@ -486,8 +634,8 @@ class Soil:
                 target=row["target"],
                 target_type=row["target_type"],
                 created_at=row["created_at"],
-                evidence=json.loads(row["evidence"]) if row["evidence"] else None,
-                metadata=json.loads(row["metadata"]) if row["metadata"] else None,
+                evidence=json_loads(row["evidence"]) if row["evidence"] else None,
+                metadata=json_loads(row["metadata"]) if row["metadata"] else None,
             ))
         return relations
 
@@ -505,13 +653,9 @@ class Soil:
             Count of Facts
         """
         if _type:
-            cursor = self._get_connection().execute(
-                "SELECT COUNT(*) FROM item WHERE _type = ?", (_type,)
-            )
+            cursor = self._get_connection().execute(_SQL_COUNT_ITEMS_BY_TYPE, (_type,))
         else:
-            cursor = self._get_connection().execute(
-                "SELECT COUNT(*) FROM item"
-            )
+            cursor = self._get_connection().execute(_SQL_COUNT_ITEMS)
         return cursor.fetchone()[0]
 
     def count_relations(self, kind: str | None = None) -> int:
@@ -524,13 +668,9 @@ class Soil:
             Count of relations
         """
         if kind:
-            cursor = self._get_connection().execute(
-                "SELECT COUNT(*) FROM system_relation WHERE kind = ?", (kind,)
-            )
+            cursor = self._get_connection().execute(_SQL_COUNT_RELATIONS_BY_KIND, (kind,))
         else:
-            cursor = self._get_connection().execute(
-                "SELECT COUNT(*) FROM system_relation"
-            )
+            cursor = self._get_connection().execute(_SQL_COUNT_RELATIONS)
         return cursor.fetchone()[0]
 
 
@@ -538,7 +678,7 @@ class Soil:
 # CONVENIENCE FUNCTIONS
 # ============================================================================
 
-def get_soil(db_path: str | Path | None = None, init: bool = False) -> Soil:
+def get_soil(db_path: str | Path | None = None, init: bool = False, shared: bool = False) -> Soil:
     """Get or create Soil database.
 
     Database path is resolved via RFC-004:
@@ -549,6 +689,7 @@ def get_soil(db_path: str | Path | None = None, init: bool = False) -> Soil:
         db_path: Path to SQLite database file. If None, resolved via
             get_db_path('soil') using environment variables.
         init: If True, initialize schema if not exists
+        shared: If True, reuse a long-lived per-thread connection (see Soil)
 
     Returns:
         Soil instance
@@ -569,12 +710,13 @@ def get_soil(db_path: str | Path | None = None, init: bool = False) -> Soil:
         from system.host.environment import get_db_path
         db_path = get_db_path('soil')
 
-    soil = Soil(db_path)
+    soil = Soil(db_path, shared=shared)
 
     if init:
-        # Check if already initialized
-        if soil.get_schema_version() is None:
-            soil.init_schema()
+        # Operations need an active context; this one only covers the check
+        with soil:
+            if not soil.is_initialized():
+                soil.init_schema()
 
     return soil
 
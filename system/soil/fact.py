@@ -4,27 +4,53 @@ from __future__ import annotations
 
 import json
 import hashlib
-from dataclasses import dataclass, field
+import os
+import time
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
-from typing import Any, Literal
+from typing import Any, Literal, Sequence
+
+from ..serialization import json_loads
 
 # Constants
 SOIL_UUID_PREFIX = "soil_"
 EPOCH_DATE = datetime(2020, 1, 1, tzinfo=timezone.utc)
 
+# item table columns in Fact field order (see Fact.from_row)
+FACT_COLUMNS = (
+    "uuid, _type, realized_at, canonical_at, integrity_hash, "
+    "fidelity, superseded_by, superseded_at, data, metadata"
+)
+
+
+# EPOCH_DATE as a day count since the Unix epoch (it is UTC midnight)
+_EPOCH_UNIX_DAY = int(EPOCH_DATE.timestamp()) // 86400
+
 
 def current_day() -> int:
-    """Return days since epoch (2020-01-01)."""
-    return (datetime.now(timezone.utc) - EPOCH_DATE).days
+    """Return days since epoch (2020-01-01).
+
+    Computed from a single clock read: EPOCH_DATE is UTC midnight, so day
+    boundaries line up with time.time() // 86400.
+    """
+    return int(time.time() // 86400) - _EPOCH_UNIX_DAY
 
 
 def generate_soil_uuid() -> str:
-    """Generate a new Soil UUID with prefix."""
-    import uuid as uuid_lib
-    return f"{SOIL_UUID_PREFIX}{uuid_lib.uuid4()}"
+    """Generate a new Soil UUID with prefix.
+
+    Formats 16 random bytes as a canonical (hyphenated) UUID4 directly,
+    skipping the uuid.UUID object round-trip of str(uuid.uuid4()).
+    """
+    h = os.urandom(16).hex()
+    # Version nibble 4; variant bits 10xx (first nibble of group 4 is 8-b)
+    return (
+        f"{SOIL_UUID_PREFIX}{h[:8]}-{h[8:12]}-4{h[13:16]}-"
+        f"{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     """Provenance information for relations."""
     source: str  # 'soil_stated' | 'user_stated' | 'agent_inferred' | 'system_inferred'
@@ -33,11 +59,25 @@ class Evidence:
     method: str | None = None  # For inferred: 'nlp_extraction' | 'pattern_match' | etc.
 
     def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        # Slotted: no instance __dict__, so walk the dataclass fields
+        return {
+            f.name: value
+            for f in fields(self)
+            if (value := getattr(self, f.name)) is not None
+        }
+
 
+class _HashMemo:
+    """Slot for Fact's memoized hash, kept out of the dataclass fields.
 
-@dataclass
-class Fact:
+    Holds (data, hash) for the data object the hash was computed from,
+    so fields()/asdict() and Fact construction are unaffected.
+    """
+    __slots__ = ("_hash_memo",)
+
+
+@dataclass(slots=True)
+class Fact(_HashMemo):
     """Base Fact class (immutable fact in Soil)."""
     uuid: str
     _type: str  # 'Note' | 'Message' | 'Email' | 'ToolCall' | 'EntityDelta' | 'SystemEvent'
@@ -50,7 +90,35 @@ class Fact:
     data: dict = field(default_factory=dict)
     metadata: dict = field(default_factory=dict)
 
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> Fact:
+        """Build a Fact from an item row selected with FACT_COLUMNS.
+
+        Uses positional access so list queries avoid per-column name lookups.
+        """
+        return cls(
+            row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
+            json_loads(row[8]),
+            json_loads(row[9]) if row[9] else None,
+        )
+
     def compute_hash(self) -> str:
-        """Compute SHA256 hash of data fields."""
+        """Compute SHA256 hash of data fields.
+
+        The result is memoized for the current data object, so reassigning
+        data is picked up automatically. Mutating the data dict in place is
+        not detected; call recompute_hash() after doing so.
+        """
+        memo = getattr(self, "_hash_memo", None)
+        if memo is not None and memo[0] is self.data:
+            return memo[1]
+        return self.recompute_hash()
+
+    def recompute_hash(self) -> str:
+        """Compute SHA256 hash of data fields, refreshing the memoized value."""
         data_str = json.dumps(self.data, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(data_str.encode()).hexdigest()
+        digest = hashlib.sha256(data_str.encode()).hexdigest()
+        # Holding data itself (not its id) means the memo can't match a
+        # different dict that reuses the address
+        self._hash_memo = (self.data, digest)
+        return digest
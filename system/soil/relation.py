@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemRelation:
     """System relation (immutable structural fact)."""
     uuid: str
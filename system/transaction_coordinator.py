@@ -4,7 +4,8 @@ This module provides coordination for operations that span both Soil and Core
 databases, ensuring best-effort atomicity and proper failure handling.
 
 ARCHITECTURE:
-- Uses EXCLUSIVE locks on both databases for cross-DB operations
+- Uses IMMEDIATE (write) locks on both databases for cross-DB operations;
+  WAL readers proceed against their snapshot while the lock is held
 - Commits Soil first (source of truth), then Core
 - Detects inconsistency when Soil commits but Core fails
 - Startup checks identify orphaned EntityDeltas and broken hash chains
@@ -39,21 +40,72 @@ USAGE:
 
 from __future__ import annotations
 
-import json
+import logging
 import sqlite3
-from enum import Enum
+from enum import StrEnum
 from pathlib import Path
-from typing import TYPE_CHECKING
 
+from utils import uid
+
+from .core import Core, get_core
 from .exceptions import ConsistencyError
+from .host.environment import get_db_path
+from .soil.database import Soil, get_soil
+
+logger = logging.getLogger(__name__)
+
+# Entities are stored without the core_ prefix that EntityDelta.entity_id
+# may carry. The prefix is fixed, so strip it in SQL with constant offsets
+# instead of calling back into Python per row
+_CORE_PREFIX = uid.add_core_prefix("")
+
+_SQL_FIND_ORPHANED_DELTAS = f"""SELECT d.uuid, d.realized_at, d.entity_id
+   FROM (
+       SELECT uuid, realized_at, json_extract(data, '$.entity_id') AS entity_id
+       FROM item
+       WHERE _type = 'EntityDelta'
+       AND superseded_by IS NULL
+   ) d
+   WHERE d.entity_id IS NOT NULL AND d.entity_id != ''
+   AND NOT EXISTS (
+       SELECT 1 FROM core.entity e
+       WHERE e.uuid = CASE
+           WHEN substr(d.entity_id, 1, {len(_CORE_PREFIX)}) = '{_CORE_PREFIX}'
+           THEN substr(d.entity_id, {len(_CORE_PREFIX) + 1})
+           ELSE d.entity_id
+       END
+   )"""
+
+
+def _readonly_uri(db_path: Path) -> str:
+    """SQLite URI opening db_path read-only."""
+    return f"{Path(db_path).resolve().as_uri()}?mode=ro"
+
+
+def _connect_readonly(db_path: Path, row_factory=sqlite3.Row) -> sqlite3.Connection:
+    """Open db_path read-only (sqlite3.Row rows unless row_factory says otherwise)."""
+    conn = sqlite3.connect(_readonly_uri(db_path), uri=True)
+    conn.row_factory = row_factory
+    return conn
+
+
+def _configure_pragmas(conn: sqlite3.Connection) -> None:
+    """Apply the coordinator's connection PRAGMAs.
+
+    WAL lets the consistency checks read alongside in-flight writers.
+    Must run outside a transaction (journal_mode cannot change inside one).
+    """
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA cache_size = -20000")  # 20 MB page cache
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")  # 256 MB
 
-if TYPE_CHECKING:
-    from .core import Core
-    from .soil.database import Soil
 
+class SystemStatus(StrEnum):
+    """System status modes (RFC-008).
 
-class SystemStatus(Enum):
-    """System status modes (RFC-008)."""
+    Members are strings, so they compare equal to (and serialize as) their values.
+    """
 
     NORMAL = "normal"
     INCONSISTENT = "inconsistent"
@@ -66,7 +118,7 @@ class TransactionCoordinator:
     Coordinates transactions across Soil and Core databases (RFC-008).
 
     Provides best-effort atomicity for cross-database operations:
-    - EXCLUSIVE locking on both databases
+    - IMMEDIATE (single-writer) locking on both databases
     - Commit ordering: Soil first, then Core
     - Inconsistency detection and recovery tools
 
@@ -82,15 +134,74 @@ class TransactionCoordinator:
             soil_db_path: Path to Soil database. If None, uses get_db_path('soil')
             core_db_path: Path to Core database. If None, uses get_db_path('core')
         """
-        from system.host.environment import get_db_path
-
         self.soil_db_path = Path(soil_db_path) if soil_db_path else get_db_path('soil')
         self.core_db_path = Path(core_db_path) if core_db_path else get_db_path('core')
+        self._core_ro_conn: sqlite3.Connection | None = None
+
+    def _core_ro(self) -> sqlite3.Connection:
+        """Get the cached read-only Core connection used by consistency checks.
 
-    def check_consistency(self) -> SystemStatus:
+        Opened once on first use; in WAL mode it never blocks Core writers
+        and each query sees the latest committed state.
+        """
+        if self._core_ro_conn is None:
+            # Plain tuple rows: existence probes never read columns by name;
+            # queries that do opt into sqlite3.Row on their own cursor
+            self._core_ro_conn = _connect_readonly(self.core_db_path, row_factory=None)
+        return self._core_ro_conn
+
+    def close(self):
+        """Close the cached read-only Core connection."""
+        if self._core_ro_conn is not None:
+            self._core_ro_conn.close()
+            self._core_ro_conn = None
+
+    def __del__(self):
+        # __init__ may have failed before the attribute was set
+        if getattr(self, "_core_ro_conn", None) is not None:
+            self.close()
+
+    def check_consistency(self, deep: bool = True) -> SystemStatus:
         """
         Check database consistency on startup (RFC-008 INV-TX-018 to INV-TX-020).
 
+        Args:
+            deep: If True (default), run deep_check(); otherwise only
+                quick_check(), leaving the deep scan to a maintenance task
+
+        Returns:
+            SystemStatus indicating the health of the system
+        """
+        return self.deep_check() if deep else self.quick_check()
+
+    def quick_check(self) -> SystemStatus:
+        """
+        Cheap startup check that does not scan table contents.
+
+        Verifies both databases open as SQLite files and expose their base
+        tables. Cost is independent of database size.
+
+        Returns:
+            SAFE_MODE if either database is unreadable or missing its schema,
+            otherwise NORMAL (orphans and hash chains are not checked)
+        """
+        try:
+            self._core_ro().execute("SELECT 1 FROM entity LIMIT 1").fetchall()
+            conn = _connect_readonly(self.soil_db_path)
+            try:
+                conn.execute("SELECT 1 FROM item LIMIT 1").fetchall()
+            finally:
+                conn.close()
+        except sqlite3.DatabaseError as e:
+            logger.warning("Quick check failed: %s", e)
+            return SystemStatus.SAFE_MODE
+
+        return SystemStatus.NORMAL
+
+    def deep_check(self) -> SystemStatus:
+        """
+        Full consistency scan (linear in the number of deltas and entities).
+
         Checks for:
         - Orphaned EntityDeltas (Soil committed, Core did not)
         - Broken hash chains (previous_hash doesn't match)
@@ -117,7 +228,7 @@ class TransactionCoordinator:
             # Log issues but still return the status
             # (RFC-008 INV-TX-020: System starts regardless of state)
             for issue in issues:
-                print(f"[TransactionCoordinator] WARNING: {issue}")
+                logger.warning("%s", issue)
 
             if broken_chains:
                 # Database corruption detected
@@ -135,38 +246,31 @@ class TransactionCoordinator:
         - Core fails to commit (Entity not updated)
         - Process killed between commits
 
+        Runs as one anti-join inside SQLite: Core is ATTACHed read-only to a
+        read-only Soil connection, so no rows cross into Python except orphans.
+
         Returns:
             List of orphaned delta dictionaries with uuid, realized_at, entity_id
         """
-        from .soil.database import get_soil
-
         orphans = []
 
-        with get_soil(self.soil_db_path) as soil:
-            # Find all EntityDelta items
-            # NOTE: Direct _get_connection() access needed for consistency checking
-            # This is infrastructure code that operates at the connection level
-            # TODO: Consider adding public Soil.get_items_by_type() method to avoid private access
-            conn = soil._get_connection()
-            cursor = conn.execute(
-                """SELECT uuid, realized_at, data
-                   FROM item
-                   WHERE _type = 'EntityDelta'
-                   AND superseded_by IS NULL"""
-            )
+        conn = _connect_readonly(self.soil_db_path)
+        try:
+            conn.execute("ATTACH DATABASE ? AS core", (_readonly_uri(self.core_db_path),))
+
+            # entity_id is read with json_extract in C; no per-row json.loads.
+            # idx_item_type narrows the scan to EntityDeltas (an expression
+            # index on entity_id is not chosen by the planner for this shape)
+            cursor = conn.execute(_SQL_FIND_ORPHANED_DELTAS)
 
             for row in cursor.fetchall():
-                data = json.loads(row["data"])
-                entity_id = data.get("entity_id")
-
-                if entity_id:
-                    # Check if entity exists in Core
-                    if not self._entity_exists_in_core(entity_id):
-                        orphans.append({
-                            "uuid": row["uuid"],
-                            "realized_at": row["realized_at"],
-                            "entity_id": entity_id,
-                        })
+                orphans.append({
+                    "uuid": row["uuid"],
+                    "realized_at": row["realized_at"],
+                    "entity_id": row["entity_id"],
+                })
+        finally:
+            conn.close()
 
         return orphans
 
@@ -180,16 +284,13 @@ class TransactionCoordinator:
             True if entity exists, False otherwise
         """
         # Strip prefix (entities stored without prefix)
-        from utils import uid
         entity_id = uid.strip_prefix(entity_id)
 
-        with sqlite3.connect(str(self.core_db_path)) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT 1 FROM entity WHERE uuid = ?",
-                (entity_id,)
-            )
-            return cursor.fetchone() is not None
+        cursor = self._core_ro().execute(
+            "SELECT 1 FROM entity WHERE uuid = ?",
+            (entity_id,)
+        )
+        return cursor.fetchone() is not None
 
     def _find_broken_hash_chains(self) -> list[dict]:
         """
@@ -203,31 +304,25 @@ class TransactionCoordinator:
         """
         broken = []
 
-        with sqlite3.connect(str(self.core_db_path)) as conn:
-            conn.row_factory = sqlite3.Row
-
-            # Find entities with non-NULL previous_hash
-            cursor = conn.execute(
-                """SELECT uuid, previous_hash, hash, type, data, created_at
-                   FROM entity
-                   WHERE previous_hash IS NOT NULL"""
-            )
-
-            for row in cursor.fetchall():
-                # Find the entity that should have this hash
-                prev_cursor = conn.execute(
-                    "SELECT uuid, hash FROM entity WHERE hash = ?",
-                    (row["previous_hash"],)
-                )
-                prev_entity = prev_cursor.fetchone()
-
-                if prev_entity is None:
-                    # Previous entity not found - broken chain
-                    broken.append({
-                        "uuid": row["uuid"],
-                        "previous_hash": row["previous_hash"],
-                        "issue": "previous_hash not found in any entity",
-                    })
+        # Anti-join: entities whose previous_hash matches no entity's hash
+        # (one pass probing idx_entity_hash instead of a query per row;
+        # NOT EXISTS stops at the first match when hashes repeat)
+        cursor = self._core_ro().cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.execute(
+            """SELECT a.uuid, a.previous_hash
+               FROM entity a
+               WHERE a.previous_hash IS NOT NULL
+               AND NOT EXISTS (SELECT 1 FROM entity b WHERE b.hash = a.previous_hash)"""
+        )
+
+        for row in cursor.fetchall():
+            # Previous entity not found - broken chain
+            broken.append({
+                "uuid": row["uuid"],
+                "previous_hash": row["previous_hash"],
+                "issue": "previous_hash not found in any entity",
+            })
 
         return broken
 
@@ -240,7 +335,7 @@ class TransactionCoordinator:
         Context manager for coordinated cross-database transactions.
 
         Ensures best-effort atomicity across Soil and Core:
-        - EXCLUSIVE locks on both databases
+        - IMMEDIATE locks on both databases
         - Commit Soil first, then Core
         - Rollback both on exception
         - Detect inconsistency if Soil commits but Core fails
@@ -260,7 +355,7 @@ class TransactionCoordinator:
             self._soil_committed = False
 
         def __enter__(self) -> tuple["Soil", "Core"]:
-            """Begin cross-database transaction with EXCLUSIVE locks.
+            """Begin cross-database transaction with IMMEDIATE locks.
 
             Returns:
                 Tuple of (soil, core) instances
@@ -268,29 +363,39 @@ class TransactionCoordinator:
             Raises:
                 RuntimeError: If database initialization fails
             """
-            from .core import get_core
-            from .soil.database import get_soil
-
             # Create Soil instance
             self._soil = get_soil(self._coordinator.soil_db_path)
             self._soil.__enter__()
 
             # Create Core instance
-            self._core = get_core()
+            self._core = get_core(self._coordinator.core_db_path)
             self._core.__enter__()
 
             # Get raw connections for transaction coordination
             # NOTE: Direct _get_connection()/_get_conn() access is intentional here
-            # This is coordination-layer infrastructure that needs EXCLUSIVE lock control
-            # There is no public API for "begin EXCLUSIVE transaction and get connection"
+            # This is coordination-layer infrastructure that needs write lock control
+            # There is no public API for "begin IMMEDIATE transaction and get connection"
             # This is analogous to Core's internal operations that access private connections
             self._soil_conn = self._soil._get_connection()
             self._core_conn = self._core._get_conn()
-
-            # Begin EXCLUSIVE transactions on both databases
-            # (RFC-008 INV-TX-004: SERIALIZABLE via BEGIN EXCLUSIVE)
-            self._soil_conn.execute("BEGIN EXCLUSIVE")
-            self._core_conn.execute("BEGIN EXCLUSIVE")
+            # Both are set from here on, so commit/rollback need no None checks
+            assert self._soil_conn is not None and self._core_conn is not None
+
+            # Soil connections already carry these PRAGMAs (WAL, page cache,
+            # temp_store, mmap); Core's only set WAL
+            _configure_pragmas(self._core_conn)
+            # Soil is the source of truth and commits first, so its commit
+            # must be durable before Core commits: keep it at FULL here
+            # rather than the Soil default of NORMAL
+            self._soil_conn.execute("PRAGMA synchronous = FULL")
+
+            # Begin IMMEDIATE transactions on both databases
+            # (RFC-008 INV-TX-004: SERIALIZABLE). IMMEDIATE takes the single
+            # RESERVED write lock up front, so writers are still serialized;
+            # unlike EXCLUSIVE it leaves WAL readers unblocked, and they only
+            # ever see committed snapshots (Soil remains the source of truth)
+            self._soil_conn.execute("BEGIN IMMEDIATE")
+            self._core_conn.execute("BEGIN IMMEDIATE")
 
             return self._soil, self._core
 
@@ -332,33 +437,31 @@ class TransactionCoordinator:
             If Core fails after Soil commits → INCONSISTENT state
             """
             # Commit Soil first
-            if self._soil_conn:
-                try:
-                    self._soil_conn.commit()
-                    self._soil_committed = True
-                except Exception as e:
-                    # Soil commit failed - rollback both
-                    self._rollback_both()
-                    raise RuntimeError(f"Soil commit failed: {e}") from e
+            try:
+                self._soil_conn.commit()
+                self._soil_committed = True
+            except Exception as e:
+                # Soil commit failed - rollback both
+                self._rollback_both()
+                raise RuntimeError(f"Soil commit failed: {e}") from e
 
             # Commit Core second
-            if self._core_conn:
+            try:
+                self._core_conn.commit()
+            except Exception as e:
+                # Core commit failed after Soil committed → INCONSISTENT
+                # (RFC-008 INV-TX-008)
+                logger.critical("Soil committed but Core failed: %s", e)
+                logger.critical("System is now INCONSISTENT")
+                # Attempt to rollback Core (no-op if already failed)
                 try:
-                    self._core_conn.commit()
-                except Exception as e:
-                    # Core commit failed after Soil committed → INCONSISTENT
-                    # (RFC-008 INV-TX-008)
-                    print(f"[TransactionCoordinator] CRITICAL: Soil committed but Core failed: {e}")
-                    print("[TransactionCoordinator] System is now INCONSISTENT")
-                    # Attempt to rollback Core (no-op if already failed)
-                    try:
-                        self._core_conn.rollback()
-                    except Exception:
-                        pass
-                    raise ConsistencyError(
-                        "Soil committed but Core failed - system INCONSISTENT",
-                        details={"soil_committed": True, "core_error": str(e)}
-                    ) from e
+                    self._core_conn.rollback()
+                except Exception:
+                    pass
+                raise ConsistencyError(
+                    "Soil committed but Core failed - system INCONSISTENT",
+                    details={"soil_committed": True, "core_error": str(e)}
+                ) from e
 
         def _rollback_both(self):
             """
@@ -367,17 +470,15 @@ class TransactionCoordinator:
             If one database already committed, rollback is no-op on that DB.
             (RFC-008 INV-TX-010: Best-effort rollback)
             """
-            if self._soil_conn:
-                try:
-                    self._soil_conn.rollback()
-                except Exception as e:
-                    print(f"[TransactionCoordinator] Warning: Soil rollback failed: {e}")
+            try:
+                self._soil_conn.rollback()
+            except Exception as e:
+                logger.warning("Soil rollback failed: %s", e)
 
-            if self._core_conn:
-                try:
-                    self._core_conn.rollback()
-                except Exception as e:
-                    print(f"[TransactionCoordinator] Warning: Core rollback failed: {e}")
+            try:
+                self._core_conn.rollback()
+            except Exception as e:
+                logger.warning("Core rollback failed: %s", e)
 
     def cross_database_transaction(self) -> "CrossDatabaseTransaction":
         """
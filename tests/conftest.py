@@ -5,21 +5,72 @@ import tempfile
 import sqlite3
 from pathlib import Path
 from system.core import get_core, init_db as init_core_db
-from system.host.environment import get_db_path
+from system.host.environment import get_db_path, resolve_context
+from system.soil import Soil
 
 
-@pytest.fixture(autouse=True)
-def clean_database_before_tests():
-    """Clean database before each test module to ensure isolation.
+# RAM-backed directory for test databases when available (Linux)
+_RAM_DIR = Path("/dev/shm")
+
+
+@pytest.fixture(scope="session")
+def test_data_dir():
+    """Point default database paths at a throwaway, preferably in-RAM, directory.
+
+    Test databases need no durability, so unless the caller already chose
+    a location (MEMOGARDEN_DATA_DIR or MEMOGARDEN_{SOIL,CORE}_DB) they are
+    created under /dev/shm, where commits never reach disk. Falls back to
+    the system temp directory elsewhere.
+    """
+    import os
+
+    configured = any(
+        os.environ.get(var)
+        for var in ("MEMOGARDEN_DATA_DIR", "MEMOGARDEN_SOIL_DB", "MEMOGARDEN_CORE_DB")
+    )
+    if configured:
+        yield None
+        return
+
+    ram_dir = str(_RAM_DIR) if _RAM_DIR.is_dir() else None
+    with tempfile.TemporaryDirectory(prefix="memogarden-tests-", dir=ram_dir) as tmpdir:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("MEMOGARDEN_DATA_DIR", tmpdir)
+            yield Path(tmpdir)
 
-    This ensures that data from previous test runs doesn't interfere.
-    Runs automatically before all tests in the module.
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_core_connections():
+    """Open Core connections with synchronous=NORMAL for the test session.
+
+    Production Core connections keep SQLite's default synchronous=FULL;
+    test databases are throwaway, so the per-commit fsync is skipped.
+    """
+    import system.core
+
+    create_connection = system.core._create_connection
+
+    def _create_fast_connection(db_path=None):
+        conn = create_connection(db_path)
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(system.core, "_create_connection", _create_fast_connection)
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def init_databases_once(test_data_dir):
+    """Initialize Core and Soil schemas once per test session.
+
+    Schema setup does not change between tests, so the connects and
+    sqlite_master probes run once rather than before every test.
     """
     init_core_db()  # Initialize Core database
 
     # Initialize Soil database
     from system.soil import get_soil
-    from system.schemas import get_sql_schema
 
     soil_db_path = get_db_path('soil')
     soil_db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -42,23 +93,70 @@ def clean_database_before_tests():
         with get_soil() as soil:
             soil.init_schema()
 
-    # Clean all items from previous test runs
+    yield
+
+
+@pytest.fixture(scope="session")
+def core_conn(init_databases_once):
+    """Raw connection to the Core database, shared by the whole session.
+
+    For tests that only need a connection to pass along (not a Core
+    transaction), so the file is opened once rather than per test.
+    """
+    conn = sqlite3.connect(str(get_db_path('core')))
+    conn.row_factory = sqlite3.Row
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(autouse=True)
+def clean_database_before_tests(init_databases_once):
+    """Clean database before each test to ensure isolation.
+
+    This ensures that data from previous tests doesn't interfere.
+    Runs automatically before all tests.
+    """
+    from system.soil import get_soil
+
+    # Clean data committed by previous tests. Skip the write (and its
+    # journal/fsync) when the table is already empty, which is the common
+    # case since db_core/core_with_data roll back instead of committing
     with get_soil() as soil:
-        soil._get_connection().execute("DELETE FROM item")
-        soil._get_connection().commit()
+        conn = soil._get_connection()
+        if conn.execute("SELECT 1 FROM item LIMIT 1").fetchone():
+            conn.execute("DELETE FROM item")
 
     core = get_core()
 
     # Clean all entities from previous test runs
     with core:
-        core._conn.execute("DELETE FROM entity")
-        core._conn.commit()
+        if core._conn.execute("SELECT 1 FROM entity LIMIT 1").fetchone():
+            core._conn.execute("DELETE FROM entity")
 
     yield
 
 
+@pytest.fixture(autouse=True)
+def clear_resolve_context_cache():
+    """Drop memoized RuntimeContexts so monkeypatched HOME is picked up."""
+    resolve_context.cache_clear()
+    yield
+
+
+@pytest.fixture(scope="session")
+def session_core(init_databases_once):
+    """One Core (and connection) reused by every db_core test.
+
+    Opened once per session; db_core rolls it back after each test, so
+    tests still start from a clean transaction.
+    """
+    core = get_core()
+    yield core
+    core._conn.close()
+
+
 @pytest.fixture
-def db_core():
+def db_core(session_core):
     """Create a test Core instance with temporary database.
 
     Fixture Naming Decision (Session 15):
@@ -80,10 +178,11 @@ def db_core():
     Implementation:
     - Uses yield to provide Core as context manager
     - Database initializes on first test run
-    - All tests share the same Core instance and database
+    - All tests share the same Core instance, connection and database
+      (session_core), instead of opening a connection per test
     - Transaction is rolled back after test for isolation
     """
-    core = get_core()
+    core = session_core
     # Manually manage context to control rollback for test isolation
     core.__enter__()
     try:
@@ -91,10 +190,26 @@ def db_core():
     finally:
         # Rollback to isolate tests (don't persist test data)
         core._conn.rollback()
-        core._conn.close()
         core._in_context = False
 
 
+@pytest.fixture
+def sql_statements(db_core):
+    """Record every SQL statement db_core's connection executes.
+
+    Lets tests pin how many queries an operation issues, so an accidental
+    per-row query shows up as a failure rather than a slowdown. SQLite
+    re-reports a statement for each trigger it fires, so count distinct
+    statements (set(sql_statements)) rather than list entries.
+    """
+    statements = []
+    db_core._conn.set_trace_callback(statements.append)
+    try:
+        yield statements
+    finally:
+        db_core._conn.set_trace_callback(None)
+
+
 @pytest.fixture
 def core_with_data():
     """Create a test Core instance with sample Scope data."""
@@ -114,3 +229,25 @@ def core_with_data():
         core._conn.rollback()
         core._conn.close()
         core._in_context = False
+
+
+@pytest.fixture(scope="session")
+def soil_template():
+    """In-memory Soil database with the schema applied, built once per session."""
+    with Soil(":memory:") as template:
+        template.init_schema()
+        yield template
+
+
+@pytest.fixture
+def soil(soil_template):
+    """Fresh Soil with its schema initialized, on a private in-memory database.
+
+    The schema is copied page-by-page from soil_template with
+    Connection.backup() instead of re-running the DDL for every test.
+    Tests about files on disk or reopening a database still create their
+    own in a temporary directory.
+    """
+    with Soil(":memory:") as soil:
+        soil_template._conn.backup(soil._conn)
+        yield soil
@@ -277,6 +277,55 @@ class TestArtifactCommitIntegration:
                     based_on_hash=wrong_hash,
                 )
 
+    def test_commit_deltas_applies_chain(self):
+        """Batched commit applies each delta on top of the previous one."""
+        with get_core() as core:
+            artifact_uuid = core.entity.create(
+                entity_type="Artifact",
+                data={
+                    "label": "Test Artifact",
+                    "content": "Content",
+                    "content_type": "text/plain",
+                }
+            )
+
+            first_hash = core.entity.get_current_hash(artifact_uuid)
+            after_first = compute_content_hash("[^abc]\nContent")
+            results = core.artifact.commit_deltas(artifact_uuid, [
+                {"ops_string": "+1:^abc", "references": ["^abc"], "based_on_hash": first_hash},
+                {"ops_string": "+1:^def", "references": ["^def"], "based_on_hash": after_first},
+            ])
+
+            assert [r["previous_hash"] for r in results] == [first_hash, after_first]
+            assert results[0]["new_hash"] == after_first
+            assert results[1]["new_content"] == "[^def]\n[^abc]\nContent"
+            assert core.entity.get_current_hash(artifact_uuid) == results[1]["new_hash"]
+            assert [d["delta_uuid"] for d in core.artifact.list_deltas(artifact_uuid)] == [
+                r["delta_uuid"] for r in results
+            ]
+
+    def test_commit_deltas_broken_chain_writes_nothing(self):
+        """A conflict anywhere in the batch leaves the artifact untouched."""
+        with get_core() as core:
+            artifact_uuid = core.entity.create(
+                entity_type="Artifact",
+                data={
+                    "label": "Test Artifact",
+                    "content": "Content",
+                    "content_type": "text/plain",
+                }
+            )
+
+            first_hash = core.entity.get_current_hash(artifact_uuid)
+            with pytest.raises(ConflictError):
+                core.artifact.commit_deltas(artifact_uuid, [
+                    {"ops_string": "+1:^abc", "references": ["^abc"], "based_on_hash": first_hash},
+                    {"ops_string": "+1:^def", "references": ["^def"], "based_on_hash": first_hash},
+                ])
+
+            assert core.entity.get_current_hash(artifact_uuid) == first_hash
+            assert core.artifact.list_deltas(artifact_uuid) == []
+
     def test_get_at_commit_current_state(self):
         """Get at commit for current hash returns current content."""
         with get_core() as core:
@@ -295,6 +344,64 @@ class TestArtifactCommitIntegration:
             assert result["at_commit"] == current_hash
             assert result["content"] == "Current content"
 
+    def test_get_at_commit_after_commit_returns_new_content(self):
+        """Get at commit for the hash returned by commit_delta returns current content."""
+        with get_core() as core:
+            artifact_uuid = core.entity.create(
+                entity_type="Artifact",
+                data={
+                    "label": "Test Artifact",
+                    "content": "Content",
+                    "content_type": "text/plain",
+                }
+            )
+
+            result = core.artifact.commit_delta(
+                artifact_uuid=artifact_uuid,
+                ops_string="+1:^abc",
+                references=["^abc"],
+                based_on_hash=core.entity.get_current_hash(artifact_uuid),
+            )
+
+            state = core.artifact.get_at_commit(artifact_uuid, result["new_hash"])
+            assert state["hash"] == result["new_hash"]
+            assert state["content"] == result["new_content"]
+            assert "note" not in state
+
+    def test_get_at_commit_after_update_data_uses_content_hash(self):
+        """Get at commit compares the content hash, not entity.hash, after a non-artifact update."""
+        with get_core() as core:
+            artifact_uuid = core.entity.create(
+                entity_type="Artifact",
+                data={
+                    "label": "Test Artifact",
+                    "content": "Content",
+                    "content_type": "text/plain",
+                }
+            )
+            core.artifact.commit_delta(
+                artifact_uuid=artifact_uuid,
+                ops_string="+1:^abc",
+                references=["^abc"],
+                based_on_hash=core.entity.get_current_hash(artifact_uuid),
+            )
+
+            core.entity.update_data(artifact_uuid, {
+                "label": "Test Artifact",
+                "content": "Edited elsewhere",
+                "content_type": "text/plain",
+            })
+            chain_hash = core.entity.get_current_hash(artifact_uuid)
+
+            state = core.artifact.get_at_commit(artifact_uuid, chain_hash)
+            assert "note" in state
+            assert state["hash"] == compute_content_hash("Edited elsewhere")
+
+            content_hash = compute_content_hash("Edited elsewhere")
+            state = core.artifact.get_at_commit(artifact_uuid, content_hash)
+            assert state["content"] == "Edited elsewhere"
+            assert "note" not in state
+
     def test_list_deltas_returns_commit_history(self):
         """List deltas returns commit history for artifact."""
         with get_core() as core:
@@ -114,6 +114,45 @@ class TestFoldOperation:
                 author="operator",
             )
 
+    def test_fold_log_with_empty_data(self, db_core, entity_ops):
+        """Fold treats empty log data as an empty object."""
+        log_uuid = entity_ops.create(entity_type="ConversationLog")
+        db_core._conn.execute(
+            "UPDATE entity SET data = '' WHERE uuid = ?",
+            (uid.strip_prefix(log_uuid),),
+        )
+
+        db_core.conversation.fold(
+            log_uuid=log_uuid,
+            summary_content="Summary",
+            author="operator",
+        )
+
+        data = db_core.conversation.get(log_uuid=log_uuid)["data"]
+        assert data["summary"]["content"] == "Summary"
+        assert data["collapsed"] is True
+
+    @pytest.mark.parametrize("raw_data", ["not json", "null", "[1, 2]", '"text"'])
+    def test_fold_log_with_non_object_data_raises_error(self, db_core, entity_ops, raw_data):
+        """Fold refuses malformed or non-object log data and leaves it untouched."""
+        log_uuid = entity_ops.create(entity_type="ConversationLog")
+        plain_uuid = uid.strip_prefix(log_uuid)
+        db_core._conn.execute(
+            "UPDATE entity SET data = ? WHERE uuid = ?", (raw_data, plain_uuid)
+        )
+
+        with pytest.raises(ValueError, match=plain_uuid):
+            db_core.conversation.fold(
+                log_uuid=log_uuid,
+                summary_content="Summary",
+                author="operator",
+            )
+
+        stored = db_core._conn.execute(
+            "SELECT data FROM entity WHERE uuid = ?", (plain_uuid,)
+        ).fetchone()[0]
+        assert stored == raw_data
+
 
 class TestConversationLogGet:
     """Test getting ConversationLog entities."""
@@ -160,6 +199,25 @@ class TestConversationLogGet:
         assert result["data"]["summary"]["content"] == "Folded summary"
         assert result["data"]["summary"]["author"] == "system"
 
+    def test_fold_preserves_existing_data(self, db_core, entity_ops):
+        """Fold leaves the rest of the log data (items, parent) untouched."""
+        log_uuid = entity_ops.create(
+            entity_type="ConversationLog",
+            data={"parent_uuid": None, "items": ["soil_msg1", "soil_msg2"]}
+        )
+
+        db_core.conversation.fold(
+            log_uuid=log_uuid,
+            summary_content="Folded summary",
+            author="agent",
+            fragment_ids=["^abc"],
+        )
+
+        data = db_core.conversation.get(log_uuid=log_uuid)["data"]
+        assert data["items"] == ["soil_msg1", "soil_msg2"]
+        assert data["parent_uuid"] is None
+        assert data["summary"]["fragment_ids"] == ["^abc"]
+
     def test_get_nonexistent_conversation_log_raises_error(self, db_core):
         """Get operation on non-existent log raises ResourceNotFound."""
         from system.exceptions import ResourceNotFound
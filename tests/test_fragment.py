@@ -5,6 +5,7 @@ Tests fragment ID generation, reference parsing, and resolution.
 """
 
 import pytest
+import re
 import sqlite3
 
 from system.fragment import (
@@ -17,6 +18,9 @@ from system.fragment import (
 )
 from utils import uid
 
+# Fragment ID shape per spec: ^ followed by exactly 3 lowercase base36 chars
+_FRAG_ID_RE = re.compile(r"\^[0-9a-z]{3}")
+
 
 class TestFragmentGeneration:
     """Tests for fragment ID generation."""
@@ -25,15 +29,13 @@ class TestFragmentGeneration:
         """Generate fragment ID from simple text."""
         frag_id = generate_fragment_id("hello world")
 
-        assert frag_id.startswith("^")
-        assert len(frag_id) == 4  # ^ + exactly 3 chars
+        assert _FRAG_ID_RE.fullmatch(frag_id)  # ^ + exactly 3 chars
 
     def test_generate_fragment_id_sentence(self):
         """Generate fragment ID from sentence."""
         frag_id = generate_fragment_id("Approve: Use RFC-009")
 
-        assert frag_id.startswith("^")
-        assert len(frag_id) == 4  # ^ + exactly 3 chars
+        assert _FRAG_ID_RE.fullmatch(frag_id)  # ^ + exactly 3 chars
 
     def test_generate_fragment_id_full_hash(self):
         """Generate fragment ID from longer content."""
@@ -41,8 +43,7 @@ class TestFragmentGeneration:
             "The fragment system provides semantic reference tracking for Messages."
         )
 
-        assert frag_id.startswith("^")
-        assert len(frag_id) == 4  # ^ + exactly 3 chars
+        assert _FRAG_ID_RE.fullmatch(frag_id)  # ^ + exactly 3 chars
 
     def test_generate_fragment_id_deterministic(self):
         """Same content produces same fragment ID."""
@@ -53,14 +54,21 @@ class TestFragmentGeneration:
 
         assert frag_id1 == frag_id2  # Deterministic
 
+    def test_generate_fragment_id_cached(self):
+        """Repeated content is served from the cache with the same ID."""
+        generate_fragment_id.cache_clear()
+
+        frag_id = generate_fragment_id("Cached fragment")
+        assert generate_fragment_id("Cached fragment") == frag_id
+        assert generate_fragment_id.cache_info().hits == 1
+
     def test_generate_fragment_id_cap_at_three_chars(self):
         """Fragment ID is always exactly 4 characters total (^ + 3 chars)."""
         # Very long content still produces 3-char fragment after ^
         frag_id = generate_fragment_id("x" * 100)
 
-        assert frag_id.startswith("^")
         # Spec requires exactly 3 chars after ^, so 4 total
-        assert len(frag_id) == 4  # ^ + exactly 3 chars
+        assert _FRAG_ID_RE.fullmatch(frag_id)
 
 
 class TestReferenceParsing:
@@ -143,6 +151,27 @@ class TestReferenceParsing:
         # ^def starts at position 13, ends at 17
         assert refs[1].span == (13, 17)
 
+    def test_parse_overlapping_reference_types(self):
+        """Each reference type is found even inside another type's match."""
+        content = "See [README:15](soil_xyz123)"
+
+        refs = parse_references(content)
+
+        assert {(ref.type, ref.target) for ref in refs} == {
+            (ReferenceType.ARTIFACT_LINE, "README:15"),
+            (ReferenceType.LOG, "soil_xyz123"),
+        }
+
+    def test_parse_artifact_line_after_long_word(self):
+        """Artifact refs are found after long colon-free words."""
+        content = "x" * 50000 + " see README:15"
+
+        refs = parse_references(content)
+
+        assert [(ref.type, ref.target) for ref in refs] == [
+            (ReferenceType.ARTIFACT_LINE, "README:15"),
+        ]
+
     def test_parse_with_invalid_reference(self):
         """Ignore invalid reference patterns."""
         content = "The value is $100"
@@ -162,37 +191,25 @@ class TestFragmentResolution:
     These tests will be re-enabled in Session 17 when ArtifactDelta operations are added.
     """
 
-    def test_resolve_fragment_not_implemented(self, db_core):
+    def test_resolve_fragment_not_implemented(self, core_conn):
         """Resolving fragment raises NotImplementedError."""
         # Import here to access the function
         from system.fragment import resolve_fragment
 
-        # Create test connection for fragment resolution test
-        import sqlite3
-        from system.host.environment import get_db_path
-        test_conn = sqlite3.connect(str(get_db_path('core')))
-        test_conn.row_factory = sqlite3.Row
-
         with pytest.raises(NotImplementedError, match=r"Session 17"):
             resolve_fragment(
-                conn=test_conn,
+                conn=core_conn,
                 scope_uuid="test_scope",
                 fragment_id="^abc"
             )
 
-    def test_resolve_artifact_line_not_implemented(self, db_core):
+    def test_resolve_artifact_line_not_implemented(self, core_conn):
         """Resolving artifact line raises NotImplementedError."""
         from system.fragment import resolve_artifact_line
 
-        # Use same test connection
-        import sqlite3
-        from system.host.environment import get_db_path
-        test_conn = sqlite3.connect(str(get_db_path('core')))
-        test_conn.row_factory = sqlite3.Row
-
         with pytest.raises(NotImplementedError, match=r"Session 17"):
             resolve_artifact_line(
-                conn=test_conn,
+                conn=core_conn,
                 artifact_uuid="test_artifact",
                 line_number=42
             )
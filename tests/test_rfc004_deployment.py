@@ -119,6 +119,14 @@ class TestResolveContext:
         assert ctx.config_dir == custom_config.parent
         assert ctx.verb == "run"
 
+    def test_resolve_context_is_memoized(self):
+        """Test resolve_context() returns the same frozen context per verb."""
+        ctx = resolve_context("deploy")
+
+        assert resolve_context("deploy") is ctx
+        with pytest.raises(AttributeError):
+            ctx.verb = "serve"
+
     def test_resolve_context_invalid_verb(self):
         """Test resolve_context() raises ValueError for invalid verb."""
         with pytest.raises(ValueError, match="Invalid verb"):
@@ -11,7 +11,7 @@ Coverage:
 
 import pytest
 
-from system.schemas import get_sql_schema, get_type_schema, list_type_schemas
+from system.schemas import _read_schema_title, get_sql_schema, get_type_schema, list_type_schemas
 
 
 class TestGetSqlSchema:
@@ -26,7 +26,7 @@ class TestGetSqlSchema:
         # Verify it's SQL
         assert 'CREATE TABLE' in schema
         # Verify it's Core schema (entity registry)
-        assert 'entity' in schema.lower()
+        assert 'entity' in schema
         assert '_schema_metadata' in schema
 
     def test_get_soil_schema(self):
@@ -38,8 +38,8 @@ class TestGetSqlSchema:
         # Verify it's SQL
         assert 'CREATE TABLE' in schema
         # Verify it's Soil schema (items, system_relations)
-        assert 'item' in schema.lower()
-        assert 'system_relation' in schema.lower()
+        assert 'item' in schema
+        assert 'system_relation' in schema
 
     def test_invalid_layer_raises_value_error(self):
         """get_sql_schema with invalid layer raises ValueError."""
@@ -116,6 +116,16 @@ class TestGetTypeSchema:
         schema = get_type_schema('facts', 'Email')
         assert schema['title'] == 'Email'
 
+    def test_returned_schema_is_independent_copy(self):
+        """Mutating a returned schema must not affect later calls (cached parse)."""
+        schema = get_type_schema('facts', 'Email')
+        schema['title'] = 'Mutated'
+        schema.setdefault('properties', {}).clear()
+
+        fresh = get_type_schema('facts', 'Email')
+        assert fresh['title'] == 'Email'
+        assert fresh is not schema
+
     def test_action_result_schema(self):
         """get_type_schema returns ActionResult schema (Session 6.6 structured error)."""
         schema = get_type_schema('facts', 'ActionResult')
@@ -178,6 +188,20 @@ class TestListTypeSchemas:
         assert types == sorted(types)
 
 
+    @pytest.mark.parametrize("content, expected", [
+        ('{"$schema": "x", "title": "Note", "type": "object"}', "Note"),
+        ('{"properties": {"a": {"title": "Nested"}}, "title": "Outer"}', "Outer"),
+        ('{"title": "Caf\\u00e9 \\"Q\\""}', 'Café "Q"'),
+        ('{"type": "object"}', "Sample"),
+    ])
+    def test_read_schema_title(self, tmp_path, content, expected):
+        """_read_schema_title returns the decoded top-level title, else the filename."""
+        schema_file = tmp_path / "sample.schema.json"
+        schema_file.write_text(content, encoding="utf-8")
+
+        assert _read_schema_title(schema_file) == expected
+
+
 class TestRfc004Invariants:
     """Tests for RFC-004 invariants.
 
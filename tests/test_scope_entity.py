@@ -4,12 +4,16 @@ Session 15: Scope Entity and Schema
 Tests for Scope entity CRUD operations through the generic EntityOperations API.
 """
 
+import re
+
 import pytest
 
 from system.exceptions import ResourceNotFound
 from system.schemas import get_type_schema, list_type_schemas
 from utils import uid
 
+_NOT_FOUND_RE = re.compile(r"Scope.*not found")
+
 
 class TestScopeEntityOperations:
     """Tests for Scope entity CRUD operations."""
@@ -27,65 +31,32 @@ class TestScopeEntityOperations:
         if 'allOf' in schema:
             assert any(ref.get('$ref') == 'entity.schema.json' for ref in schema['allOf'])
 
-    def test_create_scope_minimal(self, db_core):
-        """Create Scope with minimal required fields."""
-        # Create scope with only label
-        scope_uuid = db_core.entity.create(
-            entity_type='Scope',
-            data={'label': 'Test Scope'}
-        )
-
-        # Verify entity was created
-        entity = db_core.entity.get_by_id(uid.strip_prefix(scope_uuid), entity_type='Scope')
-        assert entity is not None
-        assert entity['type'] == 'Scope'
-        assert entity['data']['label'] == 'Test Scope'
-
-    def test_create_scope_with_participants(self, db_core):
-        """Create Scope with active participants."""
-        participant_id = uid.generate_uuid()
-        scope_uuid = db_core.entity.create(
-            entity_type='Scope',
-            data={
-                'label': 'Team Project',
-                'active_participants': [participant_id]
-            }
-        )
-
-        entity = db_core.entity.get_by_id(uid.strip_prefix(scope_uuid), entity_type='Scope')
-        assert entity['data']['active_participants'] == [participant_id]
-
-    def test_create_scope_with_artifacts(self, db_core):
-        """Create Scope with artifacts."""
-        artifact_id = uid.generate_uuid()
-        scope_uuid = db_core.entity.create(
-            entity_type='Scope',
-            data={
-                'label': 'Artifact Collection',
-                'artifact_uuids': [artifact_id]
-            }
-        )
-
-        entity = db_core.entity.get_by_id(uid.strip_prefix(scope_uuid), entity_type='Scope')
-        assert entity['data']['artifact_uuids'] == [artifact_id]
-
-    def test_create_scope_full(self, db_core):
-        """Create Scope with all fields."""
-        participant_id = uid.generate_uuid()
-        artifact_id = uid.generate_uuid()
-        scope_uuid = db_core.entity.create(
-            entity_type='Scope',
-            data={
+    @pytest.mark.parametrize("data", [
+        pytest.param({'label': 'Test Scope'}, id="minimal"),
+        pytest.param(
+            {'label': 'Team Project', 'active_participants': [uid.generate_uuid()]},
+            id="participants",
+        ),
+        pytest.param(
+            {'label': 'Artifact Collection', 'artifact_uuids': [uid.generate_uuid()]},
+            id="artifacts",
+        ),
+        pytest.param(
+            {
                 'label': 'Complete Scope',
-                'active_participants': [participant_id],
-                'artifact_uuids': [artifact_id]
-            }
-        )
+                'active_participants': [uid.generate_uuid()],
+                'artifact_uuids': [uid.generate_uuid()],
+            },
+            id="full",
+        ),
+    ])
+    def test_create_scope(self, db_core, data):
+        """Create Scope with each supported combination of fields."""
+        scope_uuid = db_core.entity.create(entity_type='Scope', data=data)
 
-        entity = db_core.entity.get_by_id(uid.strip_prefix(scope_uuid), entity_type='Scope')
-        assert entity['data']['label'] == 'Complete Scope'
-        assert entity['data']['active_participants'] == [participant_id]
-        assert entity['data']['artifact_uuids'] == [artifact_id]
+        entity = db_core.entity.get_by_id(scope_uuid, entity_type='Scope')
+        assert entity['type'] == 'Scope'
+        assert entity['data'] == data
 
     def test_get_scope_by_id(self, db_core):
         """Retrieve Scope by UUID."""
@@ -96,11 +67,22 @@ class TestScopeEntityOperations:
         )
 
         # Get by plain UUID
-        entity = db_core.entity.get_by_id(uid.strip_prefix(scope_uuid), entity_type='Scope')
+        entity = db_core.entity.get_by_id(scope_uuid, entity_type='Scope')
         assert entity is not None
         assert entity['uuid'] == scope_uuid
         assert entity['type'] == 'Scope'
 
+    def test_get_scope_preserves_large_integers(self, db_core):
+        """Integers beyond 64 bits in entity data read back exactly."""
+        scope_uuid = db_core.entity.create(
+            entity_type='Scope',
+            data={'label': 'Big', 'n': 2**70}
+        )
+
+        entity = db_core.entity.get_by_id(scope_uuid, entity_type='Scope')
+        assert entity['data']['n'] == 2**70
+        assert isinstance(entity['data']['n'], int)
+
     def test_get_scope_by_id_with_prefix(self, db_core):
         """Retrieve Scope by UUID with core_ prefix."""
         # Create a scope
@@ -110,11 +92,11 @@ class TestScopeEntityOperations:
         )
 
         # Get with prefix
-        entity = db_core.entity.get_by_id(scope_uuid, entity_type='Scope')
+        entity = db_core.entity.get_by_id(uid.add_core_prefix(scope_uuid), entity_type='Scope')
         assert entity is not None
         assert entity['uuid'] == scope_uuid
 
-    def test_update_scope_data(self, db_core):
+    def test_update_scope_data(self, db_core, sql_statements):
         """Update Scope data fields."""
         # Create scope
         scope_uuid = db_core.entity.create(
@@ -123,15 +105,21 @@ class TestScopeEntityOperations:
         )
 
         # Update data
+        participant_id = uid.generate_uuid()
+        sql_statements.clear()
         db_core.entity.update_data(scope_uuid, data={
             'label': 'Updated Label',
-            'active_participants': [uid.generate_uuid()]
+            'active_participants': [participant_id]
         })
+        # data UPDATE, then update_hash's SELECT + UPDATE
+        assert len(set(sql_statements)) == 3
 
         # Verify update
-        entity = db_core.entity.get_by_id(uid.strip_prefix(scope_uuid), entity_type='Scope')
+        sql_statements.clear()
+        entity = db_core.entity.get_by_id(scope_uuid, entity_type='Scope')
+        assert len(set(sql_statements)) == 1
         assert entity['data']['label'] == 'Updated Label'
-        assert 'active_participants' in entity['data']
+        assert entity['data']['active_participants'] == [participant_id]
 
     def test_query_scopes_by_type(self, db_core):
         """Query Scopes filtering by type."""
@@ -148,13 +136,12 @@ class TestScopeEntityOperations:
 
         # Should return 2 scopes
         assert len(results) == 2
-        assert all(r['type'] == 'Scope' for r in results)
+        assert {r['type'] for r in results} == {'Scope'}
 
     def test_query_scopes_with_limit(self, db_core):
         """Query Scopes with limit."""
         # Create 5 scopes
-        for i in range(5):
-            db_core.entity.create(entity_type='Scope', data={'label': f'scope {i}'})
+        db_core.entity.create_many('Scope', [{'label': f'scope {i}'} for i in range(5)])
 
         # Query with limit 3
         results, _ = db_core.entity.query_with_filters(
@@ -167,8 +154,7 @@ class TestScopeEntityOperations:
     def test_query_scopes_with_offset(self, db_core):
         """Query Scopes with offset."""
         # Create 5 scopes
-        for i in range(5):
-            db_core.entity.create(entity_type='Scope', data={'label': f'scope {i}'})
+        db_core.entity.create_many('Scope', [{'label': f'scope {i}'} for i in range(5)])
 
         # Query with offset 2, limit 2
         results, _ = db_core.entity.query_with_filters(
@@ -203,7 +189,7 @@ class TestScopeEntityOperations:
         db_core.entity.supersede(old_scope, new_scope)
 
         # Verify old scope is superseded
-        old_entity = db_core.entity.get_by_id(uid.strip_prefix(old_scope), entity_type='Scope')
+        old_entity = db_core.entity.get_by_id(old_scope, entity_type='Scope')
         assert old_entity['superseded_by'] == new_scope
         assert old_entity['superseded_at'] is not None
 
@@ -211,7 +197,7 @@ class TestScopeEntityOperations:
         """Getting nonexistent Scope raises ResourceNotFound."""
         fake_scope = uid.generate_uuid()
 
-        with pytest.raises(ResourceNotFound, match='Scope.*not found'):
+        with pytest.raises(ResourceNotFound, match=_NOT_FOUND_RE):
             db_core.entity.get_by_id(fake_scope, entity_type='Scope')
 
     def test_scope_hash_chain(self, db_core):
@@ -223,14 +209,14 @@ class TestScopeEntityOperations:
         )
 
         # Get initial hash
-        entity1 = db_core.entity.get_by_id(uid.strip_prefix(scope_uuid), entity_type='Scope')
+        entity1 = db_core.entity.get_by_id(scope_uuid, entity_type='Scope')
         hash1 = entity1['hash']
 
         # Update data
         db_core.entity.update_data(scope_uuid, data={'label': 'Updated'})
 
         # Get new hash
-        entity2 = db_core.entity.get_by_id(uid.strip_prefix(scope_uuid), entity_type='Scope')
+        entity2 = db_core.entity.get_by_id(scope_uuid, entity_type='Scope')
         hash2 = entity2['hash']
 
         # Hashes should be different
@@ -245,14 +231,14 @@ class TestScopeEntityOperations:
         )
 
         # Initial version is 1
-        entity1 = db_core.entity.get_by_id(uid.strip_prefix(scope_uuid), entity_type='Scope')
+        entity1 = db_core.entity.get_by_id(scope_uuid, entity_type='Scope')
         assert entity1['version'] == 1
 
         # Update data
         db_core.entity.update_data(scope_uuid, data={'label': 'Updated'})
 
         # Version should increment to 2
-        entity2 = db_core.entity.get_by_id(uid.strip_prefix(scope_uuid), entity_type='Scope')
+        entity2 = db_core.entity.get_by_id(scope_uuid, entity_type='Scope')
         assert entity2['version'] == 2
 
 
@@ -6,10 +6,35 @@ Run these before and after each refactoring step.
 If these tests fail after a refactoring, the refactoring changed behavior.
 """
 
+import sqlite3
+
 import pytest
-import tempfile
-from pathlib import Path
-from system.soil import Soil, Fact, SystemRelation, Evidence, generate_soil_uuid, SOIL_UUID_PREFIX
+from uuid import UUID
+from system.soil import (
+    Soil, Fact, SystemRelation, Evidence, generate_soil_uuid, SOIL_UUID_PREFIX,
+    close_shared_connections, get_soil,
+)
+
+_NOTE_TS = "2026-01-30T12:00:00Z"
+
+
+def make_note(description: str, at: str = _NOTE_TS) -> Fact:
+    """Build a Note Fact realized and canonical at the same instant."""
+    return Fact(
+        uuid=generate_soil_uuid(),
+        _type="Note",
+        realized_at=at,
+        canonical_at=at,
+        data={"description": description}
+    )
+
+
+def roundtrip_fact(soil, item: Fact) -> Fact:
+    """Store item, read it back by UUID, and return the stored copy."""
+    uuid = soil.create_fact(item)
+    retrieved = soil.get_fact(uuid)
+    assert retrieved is not None
+    return retrieved
 
 
 class TestSoilUUIDs:
@@ -27,6 +52,8 @@ class TestSoilUUIDs:
         # UUID4 format: 8-4-4-4-12 hex digits
         uuid_part = uuid[len(SOIL_UUID_PREFIX):]
         assert len(uuid_part) == 36
+        assert str(UUID(uuid_part)) == uuid_part
+        assert UUID(uuid_part).version == 4
 
     def test_uuid_is_unique(self):
         """Each call should generate a unique UUID."""
@@ -34,6 +61,23 @@ class TestSoilUUIDs:
         assert len(set(uuids)) == 100, "Generated duplicate UUIDs"
 
 
+class TestCurrentDay:
+    """Characterize current_day() at UTC day boundaries."""
+
+    def test_day_boundary_uses_single_clock_read(self, monkeypatch):
+        """The last and first second around UTC midnight map to consecutive days."""
+        from datetime import datetime, timezone
+        from system.soil import fact as fact_module
+
+        midnight = datetime(2026, 1, 31, tzinfo=timezone.utc)
+        expected = (midnight - fact_module.EPOCH_DATE).days
+
+        monkeypatch.setattr(fact_module.time, "time", lambda: midnight.timestamp() - 0.5)
+        assert fact_module.current_day() == expected - 1
+        monkeypatch.setattr(fact_module.time, "time", lambda: midnight.timestamp())
+        assert fact_module.current_day() == expected
+
+
 class TestItemCreation:
     """Characterize Item creation behavior."""
 
@@ -49,421 +93,413 @@ class TestItemCreation:
         assert item._type == "Note"
         assert item.data["description"] == "Test note"
 
-    def test_item_stored_in_database(self):
-        """Items can be stored and retrieved from database."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+    def test_hash_is_memoized_until_recomputed(self):
+        """compute_hash() is memoized; recompute_hash() reflects replaced data."""
+        item = Fact(
+            uuid=generate_soil_uuid(),
+            _type="Note",
+            realized_at="2026-01-30T12:00:00Z",
+            canonical_at="2026-01-30T12:00:00Z",
+            data={"description": "Test note"}
+        )
+        original_hash = item.compute_hash()
+        assert item.compute_hash() == original_hash
 
-                item = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={"description": "Test note", "count": 42}
-                )
-                uuid = soil.create_fact(item)
-
-                # Verify item was created
-                retrieved = soil.get_fact(uuid)
-                assert retrieved is not None
-                assert retrieved._type == "Note"
-                assert retrieved.data["description"] == "Test note"
-                assert retrieved.data["count"] == 42
-
-    def test_item_data_preserved_as_json(self):
-        """Item.data should be stored and retrieved as JSON dict."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+        item.data = {"description": "Changed"}
+        assert item.recompute_hash() != original_hash
+        assert item.compute_hash() == item.recompute_hash()
 
-                item = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={
-                        "description": "Test",
-                        "count": 42,
-                        "nested": {"key": "value"}
-                    }
-                )
-                soil.create_fact(item)
-
-                # Verify nested data is preserved
-                retrieved = soil.get_fact(item.uuid)
-                assert retrieved.data["description"] == "Test"
-                assert retrieved.data["count"] == 42
-                assert retrieved.data["nested"]["key"] == "value"
-
-    def test_item_metadata_is_optional(self):
-        """Items can be created without metadata."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+    def test_hash_cache_reset_when_data_reassigned(self):
+        """Reassigning data invalidates the memoized hash without a manual recompute."""
+        item = make_note("Test note")
+        original_hash = item.compute_hash()
+
+        item.data = {"description": "Changed"}
+        assert item.compute_hash() != original_hash
+        assert item.compute_hash() == make_note("Changed").compute_hash()
+
+    def test_hash_memo_is_not_a_dataclass_field(self):
+        """The memoized hash stays out of fields() and asdict()."""
+        from dataclasses import asdict, fields
 
-                item = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={"description": "Test"}
-                )
-                soil.create_fact(item)
+        item = make_note("Test note")
+        item.compute_hash()
+        assert "_hash_memo" not in {f.name for f in fields(item)}
+        assert "_hash_memo" not in asdict(item)
 
-                retrieved = soil.get_fact(item.uuid)
-                assert retrieved.metadata is None or retrieved.metadata == {}
+    def test_stored_hash_reflects_data_mutated_after_hashing(self, soil):
+        """create_fact hashes the data as stored, even if it was mutated in place."""
+        item = make_note("Test note")
+        stale_hash = item.compute_hash()
+        item.data["description"] = "Changed"
 
-    def test_item_metadata_is_stored(self):
+        soil.create_fact(item)
+        stored = soil.get_fact(item.uuid)
+
+        assert stored.integrity_hash != stale_hash
+        assert stored.integrity_hash == stored.recompute_hash()
+
+    def test_item_stored_in_database(self, soil):
+        """Items can be stored and retrieved from database."""
+        item = Fact(
+            uuid=generate_soil_uuid(),
+            _type="Note",
+            realized_at="2026-01-30T12:00:00Z",
+            canonical_at="2026-01-30T12:00:00Z",
+            data={"description": "Test note", "count": 42}
+        )
+        # Verify item was created
+        retrieved = roundtrip_fact(soil, item)
+        assert retrieved._type == "Note"
+        assert retrieved.data["description"] == "Test note"
+        assert retrieved.data["count"] == 42
+
+    def test_item_data_stored_in_stdlib_json_format(self, soil):
+        """Fact data is stored as json.dumps text and round-trips non-finite floats."""
+        import json
+
+        item = make_note("Café")
+        item.data["ratio"] = float("inf")
+        retrieved = roundtrip_fact(soil, item)
+
+        stored = soil._get_connection().execute(
+            "SELECT data FROM item WHERE uuid = ?", (item.uuid,)
+        ).fetchone()[0]
+        assert stored == json.dumps(item.data)
+        assert retrieved.data == item.data
+
+    def test_item_data_preserves_large_integers(self, soil):
+        """Integers beyond 64 bits round-trip exactly, keeping the integrity hash valid."""
+        item = make_note("Big number")
+        item.data["n"] = 2**70
+        retrieved = roundtrip_fact(soil, item)
+
+        assert retrieved.data["n"] == 2**70
+        assert isinstance(retrieved.data["n"], int)
+        assert retrieved.integrity_hash == retrieved.recompute_hash()
+
+    def test_facts_can_be_created_in_bulk(self, soil):
+        """create_facts() stores all Facts and returns UUIDs in input order."""
+        facts = [
+            Fact(
+                uuid=generate_soil_uuid(),
+                _type="Note",
+                realized_at="2026-01-30T12:00:00Z",
+                canonical_at="2026-01-30T12:00:00Z",
+                data={"description": f"Note {i}"}
+            )
+            for i in range(3)
+        ]
+        uuids = soil.create_facts(facts)
+
+        assert uuids == [fact.uuid for fact in facts]
+        assert soil.count_items() == 3
+        for fact in facts:
+            retrieved = soil.get_fact(fact.uuid)
+            assert retrieved.data == fact.data
+            assert retrieved.integrity_hash == fact.compute_hash()
+
+    def test_item_data_preserved_as_json(self, soil):
+        """Item.data should be stored and retrieved as JSON dict."""
+        item = Fact(
+            uuid=generate_soil_uuid(),
+            _type="Note",
+            realized_at="2026-01-30T12:00:00Z",
+            canonical_at="2026-01-30T12:00:00Z",
+            data={
+                "description": "Test",
+                "count": 42,
+                "nested": {"key": "value"}
+            }
+        )
+        # Verify nested data is preserved
+        retrieved = roundtrip_fact(soil, item)
+        assert retrieved.data["description"] == "Test"
+        assert retrieved.data["count"] == 42
+        assert retrieved.data["nested"]["key"] == "value"
+
+    def test_item_metadata_is_optional(self, soil):
+        """Items can be created without metadata."""
+        item = Fact(
+            uuid=generate_soil_uuid(),
+            _type="Note",
+            realized_at="2026-01-30T12:00:00Z",
+            canonical_at="2026-01-30T12:00:00Z",
+            data={"description": "Test"}
+        )
+        retrieved = roundtrip_fact(soil, item)
+        assert retrieved.metadata is None or retrieved.metadata == {}
+
+    def test_item_metadata_is_stored(self, soil):
         """Items can have metadata stored."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+        item = Fact(
+            uuid=generate_soil_uuid(),
+            _type="Email",
+            realized_at="2026-01-30T12:00:00Z",
+            canonical_at="2026-01-30T12:00:00Z",
+            data={"rfc_message_id": "<test@example.com>"},
+            metadata={"provider": "test", "labels": ["INBOX"]}
+        )
+        retrieved = roundtrip_fact(soil, item)
+        assert retrieved.metadata is not None
+        assert retrieved.metadata["provider"] == "test"
+        assert retrieved.metadata["labels"] == ["INBOX"]
 
-                item = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Email",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={"rfc_message_id": "<test@example.com>"},
-                    metadata={"provider": "test", "labels": ["INBOX"]}
-                )
-                soil.create_fact(item)
-
-                retrieved = soil.get_fact(item.uuid)
-                assert retrieved.metadata is not None
-                assert retrieved.metadata["provider"] == "test"
-                assert retrieved.metadata["labels"] == ["INBOX"]
-
-    def test_item_uuid_without_prefix_is_accepted(self):
+    def test_item_uuid_without_prefix_is_accepted(self, soil):
         """get_fact() should accept UUIDs without 'soil_' prefix."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
-
-                item = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={"description": "Test"}
-                )
-                soil.create_fact(item)
+        item = Fact(
+            uuid=generate_soil_uuid(),
+            _type="Note",
+            realized_at="2026-01-30T12:00:00Z",
+            canonical_at="2026-01-30T12:00:00Z",
+            data={"description": "Test"}
+        )
+        soil.create_fact(item)
 
-                # Get UUID without prefix
-                uuid_without_prefix = item.uuid[len(SOIL_UUID_PREFIX):]
-                retrieved = soil.get_fact(uuid_without_prefix)
-                assert retrieved is not None
-                assert retrieved.uuid == item.uuid
+        # Get UUID without prefix
+        uuid_without_prefix = item.uuid[len(SOIL_UUID_PREFIX):]
+        retrieved = soil.get_fact(uuid_without_prefix)
+        assert retrieved is not None
+        assert retrieved.uuid == item.uuid
 
 
 class TestEmailDeduplication:
     """Characterize email deduplication behavior."""
 
-    def test_email_found_by_rfc_message_id(self):
+    def test_email_found_by_rfc_message_id(self, soil):
         """Emails can be found by rfc_message_id."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+        message_id = "<test@example.com>"
+        email = Fact(
+            uuid=generate_soil_uuid(),
+            _type="Email",
+            realized_at="2026-01-30T12:00:00Z",
+            canonical_at="2026-01-30T12:00:00Z",
+            data={
+                "rfc_message_id": message_id,
+                "from_address": "sender@example.com",
+                "to_addresses": ["recipient@example.com"]
+            }
+        )
+        soil.create_fact(email)
 
-                message_id = "<test@example.com>"
-                email = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Email",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={
-                        "rfc_message_id": message_id,
-                        "from_address": "sender@example.com",
-                        "to_addresses": ["recipient@example.com"]
-                    }
-                )
-                soil.create_fact(email)
-
-                # Should find by rfc_message_id
-                found = soil.find_item_by_rfc_message_id(message_id)
-                assert found is not None
-                assert found.uuid == email.uuid
-                assert found.data["from_address"] == "sender@example.com"
-
-    def test_email_not_found_with_different_message_id(self):
-        """find_item_by_rfc_message_id returns None for non-existent ID."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+        # Should find by rfc_message_id
+        found = soil.find_item_by_rfc_message_id(message_id)
+        assert found is not None
+        assert found.uuid == email.uuid
+        assert found.data["from_address"] == "sender@example.com"
 
-                found = soil.find_item_by_rfc_message_id("<nonexistent@example.com>")
-                assert found is None
+    def test_email_not_found_with_different_message_id(self, soil):
+        """find_item_by_rfc_message_id returns None for non-existent ID."""
+        found = soil.find_item_by_rfc_message_id("<nonexistent@example.com>")
+        assert found is None
 
 
 class TestSystemRelations:
     """Characterize SystemRelation behavior."""
 
-    def test_relation_can_be_created(self):
+    def test_relation_can_be_created(self, soil):
         """System relations can be created."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+        # Create two items
+        item1 = make_note("Item 1")
+        item2 = make_note("Item 2", at="2026-01-30T12:01:00Z")
+        soil.create_fact(item1)
+        soil.create_fact(item2)
+
+        # Create relation
+        relation = SystemRelation(
+            uuid=generate_soil_uuid(),
+            kind="cites",
+            source=item2.uuid,
+            source_type="item",
+            target=item1.uuid,
+            target_type="item",
+            created_at=2230
+        )
+        uuid = soil.create_relation(relation)
 
-                # Create two items
-                item1 = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={"description": "Item 1"}
-                )
-                item2 = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:01:00Z",
-                    canonical_at="2026-01-30T12:01:00Z",
-                    data={"description": "Item 2"}
-                )
-                soil.create_fact(item1)
-                soil.create_fact(item2)
-
-                # Create relation
-                relation = SystemRelation(
-                    uuid=generate_soil_uuid(),
-                    kind="cites",
-                    source=item2.uuid,
-                    source_type="item",
-                    target=item1.uuid,
-                    target_type="item",
-                    created_at=2230
-                )
-                uuid = soil.create_relation(relation)
-
-                assert uuid is not None
-
-    def test_duplicate_relation_returns_same_uuid(self):
-        """Creating duplicate relation should return existing UUID (idempotent)."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+        assert uuid is not None
 
-                # Create two items
-                item1 = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={"description": "Item 1"}
-                )
-                item2 = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:01:00Z",
-                    canonical_at="2026-01-30T12:01:00Z",
-                    data={"description": "Item 2"}
-                )
-                soil.create_fact(item1)
-                soil.create_fact(item2)
-
-                # Create relation
-                relation = SystemRelation(
-                    uuid=generate_soil_uuid(),
-                    kind="cites",
-                    source=item2.uuid,
-                    source_type="item",
-                    target=item1.uuid,
-                    target_type="item",
-                    created_at=2230
-                )
-                uuid1 = soil.create_relation(relation)
-
-                # Try to create duplicate - should return existing UUID
-                relation.uuid = generate_soil_uuid()  # New UUID
-                uuid2 = soil.create_relation(relation)
-
-                # Should return same UUID (relation already exists)
-                assert uuid1 == uuid2
-
-    def test_relations_can_be_filtered_by_source(self):
+    def test_duplicate_relation_returns_same_uuid(self, soil):
+        """Creating duplicate relation should return existing UUID (idempotent)."""
+        # Create two items
+        item1 = make_note("Item 1")
+        item2 = make_note("Item 2", at="2026-01-30T12:01:00Z")
+        soil.create_fact(item1)
+        soil.create_fact(item2)
+
+        # Create relation
+        relation = SystemRelation(
+            uuid=generate_soil_uuid(),
+            kind="cites",
+            source=item2.uuid,
+            source_type="item",
+            target=item1.uuid,
+            target_type="item",
+            created_at=2230
+        )
+        uuid1 = soil.create_relation(relation)
+
+        # Try to create duplicate - should return existing UUID
+        relation.uuid = generate_soil_uuid()  # New UUID
+        uuid2 = soil.create_relation(relation)
+
+        # Should return same UUID (relation already exists)
+        assert uuid1 == uuid2
+
+    def test_relations_can_be_created_in_bulk(self, soil):
+        """Bulk creation should return UUIDs in order, reusing existing ones."""
+        parent = make_note("Parent")
+        soil.create_fact(parent)
+
+        evidence = Evidence(source="system_inferred", method="test")
+        relations = [
+            SystemRelation(
+                uuid=generate_soil_uuid(),
+                kind="cites",
+                source=f"soil_child_{i}",
+                source_type="item",
+                target=parent.uuid,
+                target_type="item",
+                created_at=2230,
+                evidence=evidence
+            )
+            for i in range(3)
+        ]
+        existing_uuid = soil.create_relation(relations[1])
+        relations[1].uuid = generate_soil_uuid()
+
+        uuids = soil.create_relations(relations)
+
+        assert uuids == [relations[0].uuid, existing_uuid, relations[2].uuid]
+        assert soil.count_relations(kind="cites") == 3
+        stored = soil.get_relations(source="soil_child_0")
+        assert stored[0].evidence["method"] == "test"
+
+    def test_relations_can_be_filtered_by_source(self, soil):
         """Relations can be queried by source UUID."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
-
-                # Create three items
-                item1 = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={"description": "Item 1"}
-                )
-                item2 = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:01:00Z",
-                    canonical_at="2026-01-30T12:01:00Z",
-                    data={"description": "Item 2"}
-                )
-                item3 = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:02:00Z",
-                    canonical_at="2026-01-30T12:02:00Z",
-                    data={"description": "Item 3"}
-                )
-                soil.create_fact(item1)
-                soil.create_fact(item2)
-                soil.create_fact(item3)
-
-                # Create relations: item2 cites item1, item3 cites item1
-                soil.create_relation(SystemRelation(
-                    uuid=generate_soil_uuid(),
-                    kind="cites",
-                    source=item2.uuid,
-                    source_type="item",
-                    target=item1.uuid,
-                    target_type="item",
-                    created_at=2230
-                ))
-                soil.create_relation(SystemRelation(
-                    uuid=generate_soil_uuid(),
-                    kind="cites",
-                    source=item3.uuid,
-                    source_type="item",
-                    target=item1.uuid,
-                    target_type="item",
-                    created_at=2230
-                ))
-
-                # Query relations from item2
-                relations = soil.get_relations(source=item2.uuid)
-                assert len(relations) == 1
-                assert relations[0].kind == "cites"
-                assert relations[0].source == item2.uuid
-
-    def test_relations_can_be_filtered_by_kind(self):
+        # Create three items
+        item1 = make_note("Item 1")
+        item2 = make_note("Item 2", at="2026-01-30T12:01:00Z")
+        item3 = make_note("Item 3", at="2026-01-30T12:02:00Z")
+        soil.create_fact(item1)
+        soil.create_fact(item2)
+        soil.create_fact(item3)
+
+        # Create relations: item2 cites item1, item3 cites item1
+        soil.create_relation(SystemRelation(
+            uuid=generate_soil_uuid(),
+            kind="cites",
+            source=item2.uuid,
+            source_type="item",
+            target=item1.uuid,
+            target_type="item",
+            created_at=2230
+        ))
+        soil.create_relation(SystemRelation(
+            uuid=generate_soil_uuid(),
+            kind="cites",
+            source=item3.uuid,
+            source_type="item",
+            target=item1.uuid,
+            target_type="item",
+            created_at=2230
+        ))
+
+        # Query relations from item2
+        relations = soil.get_relations(source=item2.uuid)
+        assert len(relations) == 1
+        assert relations[0].kind == "cites"
+        assert relations[0].source == item2.uuid
+
+    def test_relations_can_be_filtered_by_kind(self, soil):
         """Relations can be queried by kind."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
-
-                # Create two items
-                item1 = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={"description": "Item 1"}
-                )
-                item2 = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:01:00Z",
-                    canonical_at="2026-01-30T12:01:00Z",
-                    data={"description": "Item 2"}
-                )
-                soil.create_fact(item1)
-                soil.create_fact(item2)
-
-                # Create relations of different kinds
-                soil.create_relation(SystemRelation(
-                    uuid=generate_soil_uuid(),
-                    kind="cites",
-                    source=item2.uuid,
-                    source_type="item",
-                    target=item1.uuid,
-                    target_type="item",
-                    created_at=2230
-                ))
-                soil.create_relation(SystemRelation(
-                    uuid=generate_soil_uuid(),
-                    kind="replies_to",
-                    source=item2.uuid,
-                    source_type="item",
-                    target=item1.uuid,
-                    target_type="item",
-                    created_at=2230
-                ))
-
-                # Query by kind
-                cites_relations = soil.get_relations(source=item2.uuid, kind="cites")
-                replies_relations = soil.get_relations(source=item2.uuid, kind="replies_to")
-
-                assert len(cites_relations) == 1
-                assert len(replies_relations) == 1
-                assert cites_relations[0].kind == "cites"
-                assert replies_relations[0].kind == "replies_to"
-
-    def test_replies_to_relation_helper(self):
+        # Create two items
+        item1 = make_note("Item 1")
+        item2 = make_note("Item 2", at="2026-01-30T12:01:00Z")
+        soil.create_fact(item1)
+        soil.create_fact(item2)
+
+        # Create relations of different kinds
+        soil.create_relation(SystemRelation(
+            uuid=generate_soil_uuid(),
+            kind="cites",
+            source=item2.uuid,
+            source_type="item",
+            target=item1.uuid,
+            target_type="item",
+            created_at=2230
+        ))
+        soil.create_relation(SystemRelation(
+            uuid=generate_soil_uuid(),
+            kind="replies_to",
+            source=item2.uuid,
+            source_type="item",
+            target=item1.uuid,
+            target_type="item",
+            created_at=2230
+        ))
+
+        # Query by kind
+        cites_relations = soil.get_relations(source=item2.uuid, kind="cites")
+        replies_relations = soil.get_relations(source=item2.uuid, kind="replies_to")
+
+        assert len(cites_relations) == 1
+        assert len(replies_relations) == 1
+        assert cites_relations[0].kind == "cites"
+        assert replies_relations[0].kind == "replies_to"
+
+    def test_replies_to_relation_helper(self, soil):
         """create_replies_to_relation() creates replies_to relation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+        # Create parent and reply items
+        parent = Fact(
+            uuid=generate_soil_uuid(),
+            _type="Email",
+            realized_at="2026-01-30T12:00:00Z",
+            canonical_at="2026-01-30T12:00:00Z",
+            data={"rfc_message_id": "<parent@example.com>"}
+        )
+        reply = Fact(
+            uuid=generate_soil_uuid(),
+            _type="Email",
+            realized_at="2026-01-30T12:01:00Z",
+            canonical_at="2026-01-30T12:01:00Z",
+            data={"rfc_message_id": "<reply@example.com>"}
+        )
+        soil.create_fact(parent)
+        soil.create_fact(reply)
 
-                # Create parent and reply items
-                parent = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Email",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={"rfc_message_id": "<parent@example.com>"}
-                )
-                reply = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Email",
-                    realized_at="2026-01-30T12:01:00Z",
-                    canonical_at="2026-01-30T12:01:00Z",
-                    data={"rfc_message_id": "<reply@example.com>"}
-                )
-                soil.create_fact(parent)
-                soil.create_fact(reply)
-
-                # Create replies_to relation
-                relation_uuid = soil.create_replies_to_relation(
-                    reply_uuid=reply.uuid,
-                    parent_uuid=parent.uuid
-                )
-
-                assert relation_uuid is not None
-
-                # Verify relation was created
-                relations = soil.get_relations(source=reply.uuid, kind="replies_to")
-                assert len(relations) == 1
-                assert relations[0].target == parent.uuid
-
-    def test_replies_to_relation_returns_none_if_parent_not_found(self):
-        """create_replies_to_relation() returns None if parent doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+        # Create replies_to relation
+        relation_uuid = soil.create_replies_to_relation(
+            reply_uuid=reply.uuid,
+            parent_uuid=parent.uuid
+        )
 
-                # Create only reply item
-                reply = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Email",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={"rfc_message_id": "<reply@example.com>"}
-                )
-                soil.create_fact(reply)
+        assert relation_uuid is not None
 
-                # Try to create relation to non-existent parent
-                relation_uuid = soil.create_replies_to_relation(
-                    reply_uuid=reply.uuid,
-                    parent_uuid="soil_nonexistent_uuid"
-                )
+        # Verify relation was created
+        relations = soil.get_relations(source=reply.uuid, kind="replies_to")
+        assert len(relations) == 1
+        assert relations[0].target == parent.uuid
 
-                assert relation_uuid is None
+    def test_replies_to_relation_returns_none_if_parent_not_found(self, soil):
+        """create_replies_to_relation() returns None if parent doesn't exist."""
+        # Create only reply item
+        reply = Fact(
+            uuid=generate_soil_uuid(),
+            _type="Email",
+            realized_at="2026-01-30T12:00:00Z",
+            canonical_at="2026-01-30T12:00:00Z",
+            data={"rfc_message_id": "<reply@example.com>"}
+        )
+        soil.create_fact(reply)
+
+        # Try to create relation to non-existent parent
+        relation_uuid = soil.create_replies_to_relation(
+            reply_uuid=reply.uuid,
+            parent_uuid="soil_nonexistent_uuid"
+        )
+
+        assert relation_uuid is None
 
 
 class TestDatabaseInitialization:
@@ -471,292 +507,272 @@ class TestDatabaseInitialization:
 
     def test_schema_version_is_set(self):
         """After init_schema(), schema version should be set."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+        with Soil(":memory:") as soil:
+            soil.init_schema()
 
-                version = soil.get_schema_version()
-                assert version is not None
-                assert version == "20260130"
+            version = soil.get_schema_version()
+            assert version is not None
+            assert version == "20260130"
 
     def test_reinit_is_idempotent(self):
         """Calling init_schema() twice should not fail."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
-                soil.init_schema()  # Should not fail
-
-                version = soil.get_schema_version()
-                assert version == "20260130"
-
-    def test_database_file_is_created(self):
+        with Soil(":memory:") as soil:
+            soil.init_schema()
+            soil.init_schema()  # Should not fail
+
+            version = soil.get_schema_version()
+            assert version == "20260130"
+
+    def test_is_initialized_tracks_init_schema(self, tmp_path):
+        """is_initialized() should flip to True once init_schema() runs."""
+        db_path = tmp_path / "test.db"
+        with Soil(db_path) as soil:
+            assert soil.is_initialized() is False
+            soil.init_schema()
+            assert soil.is_initialized() is True
+
+    def test_get_soil_init_initializes_new_database(self, tmp_path):
+        """get_soil(init=True) should initialize a fresh database, once."""
+        db_path = tmp_path / "test.db"
+        soil = get_soil(db_path, init=True)
+        with soil:
+            assert soil.is_initialized() is True
+            soil.create_fact(make_note("Kept"))
+
+        with get_soil(db_path, init=True) as soil:
+            assert soil.count_items() == 1
+
+    def test_database_file_is_created(self, tmp_path):
         """Database file should be created after init_schema()."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+        db_path = tmp_path / "test.db"
+        with Soil(db_path) as soil:
+            soil.init_schema()
 
-            assert db_path.exists()
+        assert db_path.exists()
 
-    def test_context_manager_works(self):
+    def test_context_manager_works(self, tmp_path):
         """Soil can be used as context manager."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-
-            item_uuid = None
-            with Soil(db_path) as soil:
+        db_path = tmp_path / "test.db"
+
+        item_uuid = None
+        with Soil(db_path) as soil:
+            soil.init_schema()
+            item = Fact(
+                uuid=generate_soil_uuid(),
+                _type="Note",
+                realized_at="2026-01-30T12:00:00Z",
+                canonical_at="2026-01-30T12:00:00Z",
+                data={"description": "Test"}
+            )
+            item_uuid = item.uuid
+            soil.create_fact(item)
+
+        # Connection should be closed after context
+        # But data should be committed
+        with Soil(db_path) as soil2:
+            retrieved = soil2.get_fact(item_uuid)
+            assert retrieved is not None
+
+
+class TestSharedConnections:
+    """Characterize Soil(shared=True) SAVEPOINT-scoped transactions."""
+
+    @staticmethod
+    def _committed_descriptions(db_path) -> list[str]:
+        """Read item descriptions through a separate, fresh connection."""
+        conn = sqlite3.connect(db_path)
+        try:
+            rows = conn.execute(
+                "SELECT json_extract(data, '$.description') FROM item ORDER BY rowid"
+            ).fetchall()
+        finally:
+            conn.close()
+        return [row[0] for row in rows]
+
+    def test_connection_is_reused_across_contexts(self, tmp_path):
+        """Shared Soils should reuse one connection and keep committed data."""
+        db_path = tmp_path / "test.db"
+        try:
+            with Soil(db_path, shared=True) as soil:
+                soil.init_schema()
+                conn = soil._get_connection()
+            with Soil(db_path, shared=True) as soil:
+                assert soil._get_connection() is conn
+                soil.create_fact(make_note("Kept"))
+            with Soil(db_path, shared=True) as soil:
+                assert soil.count_items() == 1
+            assert self._committed_descriptions(db_path) == ["Kept"]
+        finally:
+            close_shared_connections()
+
+    def test_write_after_init_schema_in_same_context_is_committed(self, tmp_path):
+        """Writes following init_schema() in one shared block reach the database."""
+        db_path = tmp_path / "test.db"
+        try:
+            with Soil(db_path, shared=True) as soil:
                 soil.init_schema()
-                item = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={"description": "Test"}
-                )
-                item_uuid = item.uuid
-                soil.create_fact(item)
-
-            # Connection should be closed after context
-            # But data should be committed
-            with Soil(db_path) as soil2:
-                retrieved = soil2.get_fact(item_uuid)
-                assert retrieved is not None
+                soil.create_fact(make_note("First"))
+            assert self._committed_descriptions(db_path) == ["First"]
+
+            with Soil(db_path, shared=True) as soil:
+                soil.create_fact(make_note("Second"))
+            assert self._committed_descriptions(db_path) == ["First", "Second"]
+        finally:
+            close_shared_connections()
+
+    def test_exception_rolls_back_context(self, tmp_path):
+        """An exception should roll back only the failing context's writes."""
+        db_path = tmp_path / "test.db"
+        try:
+            with Soil(db_path, shared=True) as soil:
+                soil.init_schema()
+
+            with Soil(db_path, shared=True) as outer:
+                outer.create_fact(make_note("Outer"))
+                with pytest.raises(ValueError):
+                    with Soil(db_path, shared=True) as inner:
+                        inner.create_fact(make_note("Inner"))
+                        raise ValueError("boom")
+
+            with Soil(db_path, shared=True) as soil:
+                assert soil.count_items() == 1
+                assert soil.list_items()[0].data["description"] == "Outer"
+            assert self._committed_descriptions(db_path) == ["Outer"]
+        finally:
+            close_shared_connections()
 
 
 class TestItemListOperations:
     """Characterize Item list/query operations."""
 
-    def test_items_can_be_listed(self):
+    def test_items_can_be_listed(self, soil):
         """Items can be listed without filters."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+        # Create multiple items
+        for i in range(3):
+            soil.create_fact(make_note(f"Note {i}"))
 
-                # Create multiple items
-                for i in range(3):
-                    item = Fact(
-                        uuid=generate_soil_uuid(),
-                        _type="Note",
-                        realized_at="2026-01-30T12:00:00Z",
-                        canonical_at="2026-01-30T12:00:00Z",
-                        data={"description": f"Note {i}"}
-                    )
-                    soil.create_fact(item)
-
-                items = soil.list_items(limit=10)
-                assert len(items) == 3
-
-    def test_items_can_be_filtered_by_type(self):
+        items = soil.list_items(limit=10)
+        assert len(items) == 3
+
+    def test_items_can_be_filtered_by_type(self, soil):
         """Items can be filtered by _type."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+        # Create different item types
+        note = make_note("A note")
+        email = Fact(
+            uuid=generate_soil_uuid(),
+            _type="Email",
+            realized_at="2026-01-30T12:01:00Z",
+            canonical_at="2026-01-30T12:01:00Z",
+            data={"rfc_message_id": "<test@example.com>"}
+        )
+        soil.create_fact(note)
+        soil.create_fact(email)
 
-                # Create different item types
-                note = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={"description": "A note"}
-                )
-                email = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Email",
-                    realized_at="2026-01-30T12:01:00Z",
-                    canonical_at="2026-01-30T12:01:00Z",
-                    data={"rfc_message_id": "<test@example.com>"}
-                )
-                soil.create_fact(note)
-                soil.create_fact(email)
-
-                # Filter by type
-                notes = soil.list_items(_type="Note", limit=10)
-                emails = soil.list_items(_type="Email", limit=10)
-
-                assert len(notes) == 1
-                assert len(emails) == 1
-                assert notes[0]._type == "Note"
-                assert emails[0]._type == "Email"
-
-    def test_items_list_respects_limit(self):
-        """list_items() should respect the limit parameter."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+        # Filter by type
+        notes = soil.list_items(_type="Note", limit=10)
+        emails = soil.list_items(_type="Email", limit=10)
 
-                # Create more items than limit
-                for i in range(10):
-                    item = Fact(
-                        uuid=generate_soil_uuid(),
-                        _type="Note",
-                        realized_at=f"2026-01-30T12:{i:02d}:00Z",
-                        canonical_at=f"2026-01-30T12:{i:02d}:00Z",
-                        data={"description": f"Note {i}"}
-                    )
-                    soil.create_fact(item)
+        assert len(notes) == 1
+        assert len(emails) == 1
+        assert notes[0]._type == "Note"
+        assert emails[0]._type == "Email"
+
+    def test_items_list_respects_limit(self, soil):
+        """list_items() should respect the limit parameter."""
+        # Create more items than limit
+        soil.create_facts([
+            make_note(f"Note {i}", at=f"2026-01-30T12:{i:02d}:00Z")
+            for i in range(10)
+        ])
 
-                items = soil.list_items(limit=5)
-                assert len(items) == 5
+        items = soil.list_items(limit=5)
+        assert len(items) == 5
 
 
 class TestCountOperations:
     """Characterize count operations."""
 
-    def test_items_can_be_counted(self):
+    def test_items_can_be_counted(self, soil):
         """All items can be counted."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+        # Create multiple items
+        soil.create_facts([make_note(f"Note {i}") for i in range(5)])
 
-                # Create multiple items
-                for i in range(5):
-                    item = Fact(
-                        uuid=generate_soil_uuid(),
-                        _type="Note",
-                        realized_at="2026-01-30T12:00:00Z",
-                        canonical_at="2026-01-30T12:00:00Z",
-                        data={"description": f"Note {i}"}
-                    )
-                    soil.create_fact(item)
-
-                count = soil.count_items()
-                assert count == 5
-
-    def test_items_can_be_counted_by_type(self):
-        """Items can be counted by _type."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
+        count = soil.count_items()
+        assert count == 5
 
-                # Create different item types
-                for i in range(3):
-                    note = Fact(
-                        uuid=generate_soil_uuid(),
-                        _type="Note",
-                        realized_at="2026-01-30T12:00:00Z",
-                        canonical_at="2026-01-30T12:00:00Z",
-                        data={"description": f"Note {i}"}
-                    )
-                    soil.create_fact(note)
-
-                    email = Fact(
-                        uuid=generate_soil_uuid(),
-                        _type="Email",
-                        realized_at="2026-01-30T12:01:00Z",
-                        canonical_at="2026-01-30T12:01:00Z",
-                        data={"rfc_message_id": f"<test{i}@example.com>"}
-                    )
-                    soil.create_fact(email)
-
-                note_count = soil.count_items(_type="Note")
-                email_count = soil.count_items(_type="Email")
-
-                assert note_count == 3
-                assert email_count == 3
-
-    def test_relations_can_be_counted(self):
+    def test_items_can_be_counted_by_type(self, soil):
+        """Items can be counted by _type."""
+        # Create different item types
+        facts = []
+        for i in range(3):
+            facts.append(make_note(f"Note {i}"))
+            facts.append(Fact(
+                uuid=generate_soil_uuid(),
+                _type="Email",
+                realized_at="2026-01-30T12:01:00Z",
+                canonical_at="2026-01-30T12:01:00Z",
+                data={"rfc_message_id": f"<test{i}@example.com>"}
+            ))
+        soil.create_facts(facts)
+
+        note_count = soil.count_items(_type="Note")
+        email_count = soil.count_items(_type="Email")
+
+        assert note_count == 3
+        assert email_count == 3
+
+    def test_relations_can_be_counted(self, soil):
         """All relations can be counted."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
-
-                # Create items and relations
-                item1 = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={"description": "Item 1"}
-                )
-                item2 = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:01:00Z",
-                    canonical_at="2026-01-30T12:01:00Z",
-                    data={"description": "Item 2"}
-                )
-                soil.create_fact(item1)
-                soil.create_fact(item2)
-
-                # Create multiple relations with same kind, source, target
-                # Due to UNIQUE(kind, source, target) constraint, only 1 is stored
-                for i in range(3):
-                    soil.create_relation(SystemRelation(
-                        uuid=generate_soil_uuid(),
-                        kind="cites",
-                        source=item2.uuid,
-                        source_type="item",
-                        target=item1.uuid,
-                        target_type="item",
-                        created_at=2230 + i
-                    ))
-
-                count = soil.count_relations()
-                assert count == 1  # Deduplication: only 1 unique (kind, source, target) tuple
-
-    def test_relations_can_be_counted_by_kind(self):
+        # Create items and relations
+        item1 = make_note("Item 1")
+        item2 = make_note("Item 2", at="2026-01-30T12:01:00Z")
+        soil.create_fact(item1)
+        soil.create_fact(item2)
+
+        # Create multiple relations with same kind, source, target
+        # Due to UNIQUE(kind, source, target) constraint, only 1 is stored
+        for i in range(3):
+            soil.create_relation(SystemRelation(
+                uuid=generate_soil_uuid(),
+                kind="cites",
+                source=item2.uuid,
+                source_type="item",
+                target=item1.uuid,
+                target_type="item",
+                created_at=2230 + i
+            ))
+
+        count = soil.count_relations()
+        assert count == 1  # Deduplication: only 1 unique (kind, source, target) tuple
+
+    def test_relations_can_be_counted_by_kind(self, soil):
         """Relations can be counted by kind."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            with Soil(db_path) as soil:
-                soil.init_schema()
-
-                # Create items
-                item1 = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:00:00Z",
-                    canonical_at="2026-01-30T12:00:00Z",
-                    data={"description": "Item 1"}
-                )
-                item2 = Fact(
-                    uuid=generate_soil_uuid(),
-                    _type="Note",
-                    realized_at="2026-01-30T12:01:00Z",
-                    canonical_at="2026-01-30T12:01:00Z",
-                    data={"description": "Item 2"}
-                )
-                soil.create_fact(item1)
-                soil.create_fact(item2)
-
-                # Create relations of different kinds
-                # Due to UNIQUE(kind, source, target) constraint, each kind gets 1 relation
-                for i in range(2):
-                    soil.create_relation(SystemRelation(
-                        uuid=generate_soil_uuid(),
-                        kind="cites",
-                        source=item2.uuid,
-                        source_type="item",
-                        target=item1.uuid,
-                        target_type="item",
-                        created_at=2230 + i
-                    ))
-
-                for i in range(3):
-                    soil.create_relation(SystemRelation(
-                        uuid=generate_soil_uuid(),
-                        kind="replies_to",
-                        source=item2.uuid,
-                        source_type="item",
-                        target=item1.uuid,
-                        target_type="item",
-                        created_at=2230 + i
-                    ))
-
-                cites_count = soil.count_relations(kind="cites")
-                replies_count = soil.count_relations(kind="replies_to")
-
-                assert cites_count == 1  # Deduplication: only 1 unique (kind, source, target) tuple
-                assert replies_count == 1  # Deduplication: only 1 unique (kind, source, target) tuple
+        # Create items
+        item1 = make_note("Item 1")
+        item2 = make_note("Item 2", at="2026-01-30T12:01:00Z")
+        soil.create_facts([item1, item2])
+
+        # Create relations of different kinds
+        # Due to UNIQUE(kind, source, target) constraint, each kind gets 1 relation
+        soil.create_relations([
+            SystemRelation(
+                uuid=generate_soil_uuid(),
+                kind=kind,
+                source=item2.uuid,
+                source_type="item",
+                target=item1.uuid,
+                target_type="item",
+                created_at=2230 + i
+            )
+            for kind, repeats in (("cites", 2), ("replies_to", 3))
+            for i in range(repeats)
+        ])
+
+        cites_count = soil.count_relations(kind="cites")
+        replies_count = soil.count_relations(kind="replies_to")
+
+        assert cites_count == 1  # Deduplication: only 1 unique (kind, source, target) tuple
+        assert replies_count == 1  # Deduplication: only 1 unique (kind, source, target) tuple
 
 
 class TestEvidence:
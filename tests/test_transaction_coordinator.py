@@ -7,14 +7,14 @@ Coverage:
 - SystemStatus enum values
 - Consistency check on startup (orphaned deltas, broken chains)
 - Cross-database transaction context manager
-- EXCLUSIVE locking behavior
+- IMMEDIATE (single-writer) locking behavior
 - Commit ordering (Soil first, then Core)
 - Rollback behavior on exceptions
 - Inconsistency detection when Soil commits but Core fails
 """
 
 import sqlite3
-import tempfile
+from contextlib import closing
 from pathlib import Path
 
 import pytest
@@ -26,6 +26,56 @@ from system.schemas import get_sql_schema
 from system.transaction_coordinator import SystemStatus, TransactionCoordinator, get_transaction_coordinator
 
 
+@pytest.fixture(scope="session")
+def template_databases(tmp_path_factory):
+    """Initialized Soil and Core databases, built once per session.
+
+    temp_databases copies these instead of re-running both schemas' DDL
+    for every test.
+    """
+    tmpdir = tmp_path_factory.mktemp("coordinator-templates")
+    soil_path = tmpdir / "soil.db"
+    core_path = tmpdir / "core.db"
+
+    # Initialize Soil database (using context manager)
+    with get_soil(soil_path) as soil:
+        soil.init_schema()
+
+    # Initialize Core database
+    init_core_db(core_path)
+
+    return soil_path, core_path
+
+
+def _copy_database(src: Path, dst: Path) -> None:
+    """Copy a SQLite database page by page (safe with WAL, unlike a file copy)."""
+    with closing(sqlite3.connect(str(src))) as source, closing(sqlite3.connect(str(dst))) as target:
+        source.backup(target)
+
+
+@pytest.fixture
+def temp_databases(template_databases, tmp_path):
+    """Create initialized Soil and Core databases in a temporary directory."""
+    soil_path = tmp_path / "soil.db"
+    core_path = tmp_path / "core.db"
+    _copy_database(template_databases[0], soil_path)
+    _copy_database(template_databases[1], core_path)
+
+    return soil_path, core_path
+
+
+@pytest.fixture
+def coordinator_with_dbs(temp_databases):
+    """Create coordinator with temporary databases."""
+    soil_path, core_path = temp_databases
+    coordinator = TransactionCoordinator(
+        soil_db_path=soil_path,
+        core_db_path=core_path
+    )
+    yield coordinator, soil_path, core_path
+    coordinator.close()
+
+
 class TestSystemStatus:
     """Tests for SystemStatus enum."""
 
@@ -36,6 +86,11 @@ class TestSystemStatus:
         assert SystemStatus.READ_ONLY.value == "read_only"
         assert SystemStatus.SAFE_MODE.value == "safe_mode"
 
+    def test_system_status_compares_as_string(self):
+        """SystemStatus members are plain strings for comparison and JSON."""
+        assert SystemStatus.NORMAL == "normal"
+        assert isinstance(SystemStatus.SAFE_MODE, str)
+
 
 class TestTransactionCoordinatorInit:
     """Tests for TransactionCoordinator initialization."""
@@ -67,32 +122,6 @@ class TestTransactionCoordinatorInit:
 class TestConsistencyCheck:
     """Tests for startup consistency checks (RFC-008 INV-TX-018 to INV-TX-020)."""
 
-    @pytest.fixture
-    def temp_databases(self):
-        """Create temporary databases for testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            soil_path = Path(tmpdir) / "soil.db"
-            core_path = Path(tmpdir) / "core.db"
-
-            # Initialize Soil database (using context manager)
-            soil = get_soil(soil_path)
-            with soil:
-                soil.init_schema()
-
-            # Initialize Core database
-            import os
-            old_env = os.environ.get('MEMOGARDEN_CORE_DB')
-            try:
-                os.environ['MEMOGARDEN_CORE_DB'] = str(core_path)
-                init_core_db()
-            finally:
-                if old_env is not None:
-                    os.environ['MEMOGARDEN_CORE_DB'] = old_env
-                elif 'MEMOGARDEN_CORE_DB' in os.environ:
-                    del os.environ['MEMOGARDEN_CORE_DB']
-
-            yield soil_path, core_path
-
     def test_consistency_check_on_fresh_databases(self, temp_databases):
         """Fresh databases have NORMAL status."""
         soil_path, core_path = temp_databases
@@ -105,6 +134,32 @@ class TestConsistencyCheck:
         status = coordinator.check_consistency()
         assert status == SystemStatus.NORMAL
 
+    def test_quick_check_on_fresh_databases(self, temp_databases):
+        """quick_check() reports NORMAL for initialized databases."""
+        soil_path, core_path = temp_databases
+
+        coordinator = TransactionCoordinator(
+            soil_db_path=soil_path,
+            core_db_path=core_path
+        )
+
+        assert coordinator.quick_check() == SystemStatus.NORMAL
+        assert coordinator.check_consistency(deep=False) == SystemStatus.NORMAL
+        coordinator.close()
+
+    def test_quick_check_detects_unreadable_database(self, temp_databases):
+        """quick_check() reports SAFE_MODE when a database is not SQLite."""
+        soil_path, core_path = temp_databases
+        soil_path.write_bytes(b"not a database" * 100)
+
+        coordinator = TransactionCoordinator(
+            soil_db_path=soil_path,
+            core_db_path=core_path
+        )
+
+        assert coordinator.quick_check() == SystemStatus.SAFE_MODE
+        coordinator.close()
+
     def test_find_orphaned_deltas_empty(self, temp_databases):
         """Fresh databases have no orphaned deltas."""
         soil_path, core_path = temp_databases
@@ -129,6 +184,52 @@ class TestConsistencyCheck:
         broken = coordinator._find_broken_hash_chains()
         assert broken == []
 
+    def test_broken_hash_chain_detection(self, temp_databases):
+        """Detect entity whose previous_hash matches no entity's hash."""
+        soil_path, core_path = temp_databases
+
+        coordinator = TransactionCoordinator(
+            soil_db_path=soil_path,
+            core_db_path=core_path
+        )
+
+        # Insert a linked pair and one entity pointing at a missing hash
+        with sqlite3.connect(str(core_path)) as conn:
+            conn.executemany(
+                """INSERT INTO entity (uuid, type, hash, previous_hash, created_at, updated_at, data)
+                   VALUES (?, 'Transaction', ?, ?, '2026-02-09', '2026-02-09', '{}')""",
+                [
+                    ("ent_a", "hash_a", None),
+                    ("ent_b", "hash_b", "hash_a"),
+                    ("ent_c", "hash_c", "hash_missing"),
+                ]
+            )
+        conn.close()
+
+        broken = coordinator._find_broken_hash_chains()
+        assert [b["uuid"] for b in broken] == ["ent_c"]
+        assert broken[0]["previous_hash"] == "hash_missing"
+
+    def test_core_read_connection_is_cached_until_close(self, temp_databases):
+        """Consistency checks reuse one read-only Core connection."""
+        soil_path, core_path = temp_databases
+
+        coordinator = TransactionCoordinator(
+            soil_db_path=soil_path,
+            core_db_path=core_path
+        )
+
+        conn = coordinator._core_ro()
+        coordinator._find_broken_hash_chains()
+        assert coordinator._core_ro() is conn
+
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            conn.execute("DELETE FROM entity")
+
+        coordinator.close()
+        assert coordinator._core_ro() is not conn
+        coordinator.close()
+
     def test_entity_exists_in_core(self, temp_databases):
         """_entity_exists_in_core correctly finds entities."""
         soil_path, core_path = temp_databases
@@ -138,18 +239,9 @@ class TestConsistencyCheck:
             core_db_path=core_path
         )
 
-        # Create an entity (need to set env var for Core)
-        import os
-        old_env = os.environ.get('MEMOGARDEN_CORE_DB')
-        try:
-            os.environ['MEMOGARDEN_CORE_DB'] = str(core_path)
-            with get_core() as core:
-                entity_uuid = core.entity.create("transactions")
-        finally:
-            if old_env is not None:
-                os.environ['MEMOGARDEN_CORE_DB'] = old_env
-            elif 'MEMOGARDEN_CORE_DB' in os.environ:
-                del os.environ['MEMOGARDEN_CORE_DB']
+        # Create an entity
+        with get_core(core_path) as core:
+            entity_uuid = core.entity.create("transactions")
 
         # Entity should exist
         assert coordinator._entity_exists_in_core(entity_uuid) is True
@@ -157,7 +249,7 @@ class TestConsistencyCheck:
         # Non-existent entity should not exist
         assert coordinator._entity_exists_in_core("core_foo") is False
 
-    def test_orphaned_delta_detection(self, temp_databases):
+    def test_orphaned_delta_detection(self, temp_databases, caplog):
         """Detect EntityDelta with no matching entity."""
         soil_path, core_path = temp_databases
 
@@ -189,73 +281,66 @@ class TestConsistencyCheck:
         assert orphans[0]["entity_id"] == "core_nonexistent"
 
         # Status should be INCONSISTENT
-        status = coordinator.check_consistency()
+        with caplog.at_level("WARNING", logger="system.transaction_coordinator"):
+            status = coordinator.check_consistency()
         assert status == SystemStatus.INCONSISTENT
+        assert "Found 1 orphaned EntityDeltas" in caplog.text
 
+    def test_delta_for_existing_entity_is_not_orphaned(self, temp_databases):
+        """EntityDeltas whose (prefixed) entity_id exists in Core are not orphans."""
+        soil_path, core_path = temp_databases
 
-class TestCrossDatabaseTransaction:
-    """Tests for cross-database transaction context manager."""
+        coordinator = TransactionCoordinator(
+            soil_db_path=soil_path,
+            core_db_path=core_path
+        )
 
-    @pytest.fixture
-    def coordinator_with_dbs(self):
-        """Create coordinator with temporary databases."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            soil_path = Path(tmpdir) / "soil.db"
-            core_path = Path(tmpdir) / "core.db"
-
-            # Initialize databases
-            soil = get_soil(soil_path)
-            with soil:
-                soil.init_schema()
-
-            import os
-            old_env = os.environ.get('MEMOGARDEN_CORE_DB')
-            try:
-                os.environ['MEMOGARDEN_CORE_DB'] = str(core_path)
-                init_core_db()
-            finally:
-                if old_env is not None:
-                    os.environ['MEMOGARDEN_CORE_DB'] = old_env
-                elif 'MEMOGARDEN_CORE_DB' in os.environ:
-                    del os.environ['MEMOGARDEN_CORE_DB']
-
-            coordinator = TransactionCoordinator(
-                soil_db_path=soil_path,
-                core_db_path=core_path
+        with sqlite3.connect(str(core_path)) as conn:
+            conn.execute(
+                """INSERT INTO entity (uuid, type, hash, created_at, updated_at, data)
+                   VALUES ('existing', 'Transaction', 'hash', '2026-02-09', '2026-02-09', '{}')"""
             )
+        conn.close()
+
+        with get_soil(soil_path) as soil:
+            from system.soil.fact import Fact
+
+            soil.create_facts([
+                Fact(
+                    uuid=uuid,
+                    _type="EntityDelta",
+                    realized_at="2026-02-09T12:00:00Z",
+                    canonical_at="2026-02-09T12:00:00Z",
+                    data={"entity_id": entity_id},
+                )
+                for uuid, entity_id in [("soil_ok", "core_existing"), ("soil_orphan", "core_missing")]
+            ])
+
+        orphans = coordinator._find_orphaned_deltas()
+        assert [o["uuid"] for o in orphans] == ["soil_orphan"]
 
-            yield coordinator, soil_path, core_path
+
+class TestCrossDatabaseTransaction:
+    """Tests for cross-database transaction context manager."""
 
     def test_cross_database_transaction_success(self, coordinator_with_dbs):
         """Successful cross-DB transaction commits both databases."""
         coordinator, soil_path, core_path = coordinator_with_dbs
 
-        # Set environment variable for Core before transaction
-        import os
-        old_env = os.environ.get('MEMOGARDEN_CORE_DB')
-        try:
-            os.environ['MEMOGARDEN_CORE_DB'] = str(core_path)
-
-            with coordinator.cross_database_transaction() as (soil, core):
-                # Create entity in Core
-                entity_uuid = core.entity.create("transactions")
-
-                # Create item in Soil
-                from system.soil.fact import Fact
-                item = Fact(
-                    uuid="soil_test_item",
-                    _type="Note",
-                    realized_at="2026-02-09T12:00:00Z",
-                    canonical_at="2026-02-09T12:00:00Z",
-                    data={"content": "test"},
-                )
-                soil.create_fact(item)
+        with coordinator.cross_database_transaction() as (soil, core):
+            # Create entity in Core
+            entity_uuid = core.entity.create("transactions")
 
-        finally:
-            if old_env is not None:
-                os.environ['MEMOGARDEN_CORE_DB'] = old_env
-            elif 'MEMOGARDEN_CORE_DB' in os.environ:
-                del os.environ['MEMOGARDEN_CORE_DB']
+            # Create item in Soil
+            from system.soil.fact import Fact
+            item = Fact(
+                uuid="soil_test_item",
+                _type="Note",
+                realized_at="2026-02-09T12:00:00Z",
+                canonical_at="2026-02-09T12:00:00Z",
+                data={"content": "test"},
+            )
+            soil.create_fact(item)
 
         # Both should be committed
         with get_soil(soil_path) as s:
@@ -263,18 +348,10 @@ class TestCrossDatabaseTransaction:
             assert retrieved is not None
             assert retrieved._type == "Note"
 
-        # Need to set environment variable for Core to verify
-        try:
-            os.environ['MEMOGARDEN_CORE_DB'] = str(core_path)
-            with get_core() as c:
-                entity = c.entity.get_by_id(entity_uuid)
-                assert entity is not None
-                assert entity["type"] == "transactions"
-        finally:
-            if old_env is not None:
-                os.environ['MEMOGARDEN_CORE_DB'] = old_env
-            elif 'MEMOGARDEN_CORE_DB' in os.environ:
-                del os.environ['MEMOGARDEN_CORE_DB']
+        with get_core(core_path) as c:
+            entity = c.entity.get_by_id(entity_uuid)
+            assert entity is not None
+            assert entity["type"] == "transactions"
 
     def test_cross_database_transaction_rollback_on_exception(self, coordinator_with_dbs):
         """Exception in cross-DB transaction rolls back both databases."""
@@ -283,17 +360,8 @@ class TestCrossDatabaseTransaction:
         from system.soil.fact import Fact
 
         # Create an entity before transaction
-        import os
-        old_env = os.environ.get('MEMOGARDEN_CORE_DB')
-        try:
-            os.environ['MEMOGARDEN_CORE_DB'] = str(core_path)
-            with get_core() as core:
-                entity_uuid = core.entity.create("transactions")
-        finally:
-            if old_env is not None:
-                os.environ['MEMOGARDEN_CORE_DB'] = old_env
-            elif 'MEMOGARDEN_CORE_DB' in os.environ:
-                del os.environ['MEMOGARDEN_CORE_DB']
+        with get_core(core_path) as core:
+            entity_uuid = core.entity.create("transactions")
 
         # Transaction with exception
         with pytest.raises(RuntimeError, match="Test exception"):
@@ -329,71 +397,37 @@ class TestCrossDatabaseTransaction:
 class TestCommitOrdering:
     """Tests for Soil-first commit ordering (RFC-008 INV-TX-007)."""
 
-    @pytest.fixture
-    def coordinator_with_dbs(self):
-        """Create coordinator with temporary databases."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            soil_path = Path(tmpdir) / "soil.db"
-            core_path = Path(tmpdir) / "core.db"
-
-            # Initialize databases
-            soil = get_soil(soil_path)
-            with soil:
-                soil.init_schema()
-
-            import os
-            old_env = os.environ.get('MEMOGARDEN_CORE_DB')
-            try:
-                os.environ['MEMOGARDEN_CORE_DB'] = str(core_path)
-                init_core_db()
-            finally:
-                if old_env is not None:
-                    os.environ['MEMOGARDEN_CORE_DB'] = old_env
-                elif 'MEMOGARDEN_CORE_DB' in os.environ:
-                    del os.environ['MEMOGARDEN_CORE_DB']
-
-            coordinator = TransactionCoordinator(
-                soil_db_path=soil_path,
-                core_db_path=core_path
-            )
-
-            yield coordinator, soil_path, core_path
-
     def test_soil_commits_first(self, coordinator_with_dbs):
         """Cross-database transaction successfully commits both databases."""
         coordinator, soil_path, core_path = coordinator_with_dbs
 
-        # Set environment variable for Core
-        import os
-        old_env = os.environ.get('MEMOGARDEN_CORE_DB')
-        try:
-            os.environ['MEMOGARDEN_CORE_DB'] = str(core_path)
-
-            # Transaction should succeed
-            with coordinator.cross_database_transaction() as (soil, core):
-                entity_uuid = core.entity.create("transactions")
-
-                from system.soil.fact import Fact
-                item = Fact(
-                    uuid="soil_test_commit_order",
-                    _type="Note",
-                    realized_at="2026-02-09T12:00:00Z",
-                    canonical_at="2026-02-09T12:00:00Z",
-                    data={"content": "test"},
-                )
-                soil.create_fact(item)
+        # Transaction should succeed
+        with coordinator.cross_database_transaction() as (soil, core):
+            entity_uuid = core.entity.create("transactions")
 
-        finally:
-            if old_env is not None:
-                os.environ['MEMOGARDEN_CORE_DB'] = old_env
-            elif 'MEMOGARDEN_CORE_DB' in os.environ:
-                del os.environ['MEMOGARDEN_CORE_DB']
+            from system.soil.fact import Fact
+            item = Fact(
+                uuid="soil_test_commit_order",
+                _type="Note",
+                realized_at="2026-02-09T12:00:00Z",
+                canonical_at="2026-02-09T12:00:00Z",
+                data={"content": "test"},
+            )
+            soil.create_fact(item)
 
         # Verify both were committed
         with get_soil(soil_path) as s:
             retrieved = s.get_fact("soil_test_commit_order")
             assert retrieved is not None
 
+    def test_soil_connection_is_fully_synchronous(self, coordinator_with_dbs):
+        """Soil commits inside the transaction fsync before Core commits."""
+        coordinator, soil_path, core_path = coordinator_with_dbs
+
+        with coordinator.cross_database_transaction() as (soil, core):
+            conn = soil._get_connection()
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+
 
 class TestGetTransactionCoordinator:
     """Tests for get_transaction_coordinator convenience function."""